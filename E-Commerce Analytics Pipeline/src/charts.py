@@ -0,0 +1,155 @@
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+
+matplotlib.use("Agg")  # batch çalıştırmada pencere açılmaz, çizim ekran beklemez
+
+import matplotlib.image as mpimg
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+
+CHART_DIR = "data/processed/charts"
+MANIFEST_FILE = "manifest.json"
+DASHBOARD_PATH = "data/processed/weekly_sales_analysis.png"
+DPI = 150
+# Panel boyutu sabit tutulur; panel PNG'leri piksel piksel yan yana dizilerek pano oluşturulur
+PANEL_SIZE = (9, 4.6)
+TITLE_HEIGHT = 0.6
+
+
+def _week_axis(ax, title, ylabel):
+    ax.set_title(title)
+    ax.set_xlabel("Hafta")
+    ax.set_ylabel(ylabel)
+    ax.tick_params(axis="x", rotation=90, labelsize=6)
+    ax.grid(True, alpha=0.3)
+
+
+def plot_weekly_sales(ax, df):
+    ax.plot(df["year_week"], df["total_sales"], marker="o", color="#2196F3", linewidth=1.5, markersize=4)
+    _week_axis(ax, "Haftalık Satış Sayısı", "Satış Sayısı")
+
+
+def plot_weekly_revenue(ax, df):
+    ax.bar(df["year_week"], df["total_revenue"], color="#4CAF50", alpha=0.8)
+    _week_axis(ax, "Haftalık Tahmini Gelir ($)", "Toplam Gelir ($)")
+
+
+def plot_weekly_interactions(ax, df):
+    interaction_cols = [c for c in df.columns if c != "year_week"]
+    df.plot(x="year_week", y=interaction_cols, kind="bar", stacked=True, ax=ax,
+            color=["#FF9800", "#2196F3", "#4CAF50"])
+    _week_axis(ax, "Haftalık Etkileşim Dağılımı", "Etkileşim Sayısı")
+    ax.legend(title="Etkileşim Tipi", fontsize=8)
+
+
+def plot_weekly_conversion(ax, df):
+    ax.plot(df["year_week"], df["conversion_rate"], marker="s", color="#F44336", linewidth=1.5, markersize=4)
+    _week_axis(ax, "Haftalık Dönüşüm Oranı (%)", "Dönüşüm Oranı (%)")
+
+
+def plot_avg_order_value(ax, df):
+    ax.plot(df["year_week"], df["avg_order_value"], marker="d", color="#9C27B0", linewidth=1.5, markersize=4)
+    _week_axis(ax, "Haftalık Ortalama Sipariş Değeri ($)", "Ort. Değer ($)")
+
+
+def plot_category_share(ax, series):
+    ax.pie(series.values, labels=[c[:30] + "..." if len(c) > 30 else c for c in series.index],
+           autopct="%1.1f%%", textprops={"fontsize": 7})
+    ax.set_title(f"Genel Kategori Bazlı Satış Dağılımı (Top {len(series)})")
+
+
+# Panoda soldan sağa, yukarıdan aşağı sıra
+PANELS = {
+    "weekly_sales": plot_weekly_sales,
+    "weekly_revenue": plot_weekly_revenue,
+    "weekly_interactions": plot_weekly_interactions,
+    "weekly_conversion": plot_weekly_conversion,
+    "avg_order_value": plot_avg_order_value,
+    "category_share": plot_category_share,
+}
+
+
+def table_hash(data):
+    """Tablonun sütun adları, tipleri ve değerlerinden içerik hash'i üretir."""
+    h = hashlib.blake2b(digest_size=16)
+    frame = data.to_frame() if isinstance(data, pd.Series) else data
+    h.update(repr([(str(c), str(t)) for c, t in frame.dtypes.items()]).encode())
+    h.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def _code_digest():
+    with open(__file__, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def render_panel(name, data, path):
+    """Tek paneli kendi figüründe çizip PNG olarak kaydeder (pyplot durumu kullanılmaz)."""
+    fig = Figure(figsize=PANEL_SIZE)
+    PANELS[name](fig.add_subplot(), data)
+    fig.tight_layout()
+    fig.savefig(path, dpi=DPI)
+    return name
+
+
+def _render_title(title, path):
+    fig = Figure(figsize=(PANEL_SIZE[0] * 2, TITLE_HEIGHT))
+    fig.text(0.5, 0.5, title, ha="center", va="center", fontsize=16, fontweight="bold")
+    fig.savefig(path, dpi=DPI)
+
+
+def render_dashboard(tables, title, output=DASHBOARD_PATH, directory=CHART_DIR, max_workers=None):
+    """Panelleri ayrı süreçlerde çizer ve tek panoda birleştirir; (çizilen, atlanan) panel adlarını döner.
+
+    tables panel adı -> tablo eşlemesidir. Tablosunun hash'i ve bu modülün kodu son çizimden beri
+    değişmemiş paneller yeniden çizilmez; pano yalnızca bir panel değiştiğinde yeniden birleştirilir.
+    """
+    os.makedirs(directory, exist_ok=True)
+    manifest_path = os.path.join(directory, MANIFEST_FILE)
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    code = _code_digest()
+    previous = manifest.get("panels", {}) if manifest.get("code") == code else {}
+
+    paths = {name: os.path.join(directory, name + ".png") for name in PANELS}
+    hashes = {name: table_hash(tables[name]) for name in PANELS}
+    hashes["title"] = hashlib.blake2b(title.encode(), digest_size=16).hexdigest()
+    todo = [name for name in PANELS if previous.get(name) != hashes[name] or not os.path.exists(paths[name])]
+    skipped = [name for name in PANELS if name not in todo]
+
+    if len(todo) > 1 and max_workers != 1:
+        # fork, çağıran süreçteki iş parçacıklarının (ör. pyarrow) kilitlerini kopyalayıp kilitlenebilir;
+        # süreçler spawn ile temiz başlatılır
+        workers = min(len(todo), max_workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            for future in [pool.submit(render_panel, name, tables[name], paths[name]) for name in todo]:
+                future.result()
+    else:
+        for name in todo:
+            render_panel(name, tables[name], paths[name])
+
+    title_path = os.path.join(directory, "title.png")
+    if previous.get("title") != hashes["title"] or not os.path.exists(title_path):
+        _render_title(title, title_path)
+        todo.append("title")
+    if todo or not os.path.exists(output):
+        # Başlık şeridi iki panel genişliğindedir; ilk satır olarak eklenir
+        title_image = mpimg.imread(title_path)
+        grid = [mpimg.imread(paths[name]) for name in PANELS]
+        rows = [np.hstack(grid[i:i + 2]) for i in range(0, len(grid), 2)]
+        mpimg.imsave(output, np.vstack([title_image] + rows), dpi=DPI)
+
+    tmp = manifest_path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"code": code, "panels": hashes}, f, indent=1)
+    os.replace(tmp, manifest_path)
+    return [name for name in todo if name != "title"], skipped
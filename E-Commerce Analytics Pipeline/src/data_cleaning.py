@@ -1,168 +1,34 @@
 import pandas as pd
 import numpy as np
 import re
+import sys
 import warnings
-import os
+
+from instrument import StepTimer
+from loaders import (CLEANED_CSV_PATH, CLEANED_DTYPES, CLEANED_PATH, CLEANING_COLUMNS, CleanedWriter,
+                     pq, read_products)
+from parallel_clean import clean_parallel
+from parse_cache import ParseCache, parse_unique
+from parsers import (DIM_COLUMNS, analyze_images, as_integral, parse_price, parse_quantity, parse_weight,
+                     parse_dimensions, volumetric_weight)
+from prices import fix_prices
 
 warnings.filterwarnings("ignore")
 
-INPUT_PATH = "data/product_details.csv"
-OUTPUT_PATH = "data/cleaned_product_details.csv"
-
-df = pd.read_csv(INPUT_PATH)
-print(f"Orijinal veri: {df.shape[0]} satır, {df.shape[1]} sütun")
-print(f"Sütunlar: {df.columns.tolist()}\n")
-
-df.rename(columns={
-    "Uniqe Id": "product_id",
-    "Product Name": "product_name",
-    "Brand Name": "brand",
-    "Asin": "asin",
-    "Category": "category",
-    "Upc Ean Code": "upc_ean_code",
-    "List Price": "list_price",
-    "Selling Price": "selling_price",
-    "Quantity": "quantity",
-    "Model Number": "model_number",
-    "About Product": "about_product",
-    "Product Specification": "product_specification",
-    "Technical Details": "technical_details",
-    "Shipping Weight": "shipping_weight",
-    "Product Dimensions": "product_dimensions",
-    "Image": "image_urls",
-    "Variants": "variants",
-    "Sku": "sku",
-    "Product Url": "product_url",
-    "Stock": "stock",
-    "Product Details": "product_details",
-    "Dimensions": "dimensions",
-    "Color": "color",
-    "Ingredients": "ingredients",
-    "Direction To Use": "direction_to_use",
-    "Is Amazon Seller": "is_amazon_seller",
-    "Size Quantity Variant": "size_quantity_variant",
-    "Product Description": "product_description",
-}, inplace=True)
-
-print("✅ Sütun isimleri standartlaştırıldı.\n")
-
-dup_count_before = df.duplicated().sum()
-df.drop_duplicates(inplace=True)
-dup_id_before = df.duplicated(subset=["product_id"]).sum()
-df.drop_duplicates(subset=["product_id"], keep="first", inplace=True)
-df.reset_index(drop=True, inplace=True)
-print(f"✅ Tam tekrar eden satır kaldırıldı: {dup_count_before}")
-print(f"✅ Aynı product_id'ye sahip tekrar eden satır kaldırıldı: {dup_id_before}\n")
-
-def clean_price(series):
-    """Fiyat sütunlarını temizler: $, virgül kaldırır, aralık varsa min değeri alır."""
-    def parse_price(val):
-        if pd.isna(val):
-            return np.nan
-        val = str(val).strip()
-        if val == "" or val.lower() in ["nan", "none"]:
-            return np.nan
-        range_match = re.search(r"\$\s*([\d,.]+)\s*-\s*\$\s*([\d,.]+)", val)
-        if range_match:
-            val = range_match.group(1)
-        else:
-            val = val.replace("$", "")
-        val = val.replace(",", "").strip()
-        if val == "" or val == ".":
-            return np.nan
-        try:
-            return float(val)
-        except ValueError:
-            return np.nan
-    return series.apply(parse_price)
-
-df["selling_price"] = clean_price(df["selling_price"])
-df["list_price"] = clean_price(df["list_price"])
-
-print(f"✅ Fiyat sütunları temizlendi.")
-print(f"   selling_price NaN: {df['selling_price'].isna().sum()}")
-print(f"   list_price NaN: {df['list_price'].isna().sum()}\n")
-
-def clean_quantity(val):
-    if pd.isna(val):
-        return np.nan
-    val = str(val).strip().replace(",", "")
-    if val == "" or val == "." or val.lower() in ["nan", "none"]:
-        return np.nan
-    match = re.search(r"(\d+\.?\d*)", val)
-    if match:
-        num = float(match.group(1))
-        return int(num) if num == int(num) else num
-    return np.nan
-
-df["quantity"] = df["quantity"].apply(clean_quantity)
-print(f"✅ Quantity sütunu temizlendi. NaN: {df['quantity'].isna().sum()}\n")
-
-def clean_weight(val):
-    """Shipping weight'i ounce cinsinden sayıya çevirir."""
-    if pd.isna(val):
-        return np.nan
-    val = str(val).strip().lower()
-    if val in ["", "nan", "none", "."]:
-        return np.nan
-    val = re.sub(r"\(.*?\)", "", val).strip()
-    
-    weight_oz = 0.0
-    match_lbs = re.search(r"(\d[\d,.]*)\s*(pounds?|lbs?)", val)
-    if match_lbs:
-        num_str = match_lbs.group(1).replace(",", "")
-        # Sadece nokta olan veya boş olan değerleri atla
-        if num_str not in ("", "."):
-            try:
-                weight_oz += float(num_str) * 16
-            except ValueError:
-                pass
-    match_oz = re.search(r"(\d[\d,.]*)\s*(ounces?|oz)", val)
-    if match_oz:
-        num_str = match_oz.group(1).replace(",", "")
-        if num_str not in ("", "."):
-            try:
-                weight_oz += float(num_str)
-            except ValueError:
-                pass
-    
-    if weight_oz == 0.0:
-        clean_val = re.sub(r"[^0-9.]", "", val)
-        if clean_val and clean_val != ".":
-            try:
-                weight_oz = float(clean_val) * 16
-            except ValueError:
-                return np.nan
-    
-    return weight_oz if weight_oz > 0 else np.nan
-
-df["shipping_weight_oz"] = df["shipping_weight"].apply(clean_weight)
-print(f"✅ Shipping weight sayısallaştırıldı (ounces). NaN: {df['shipping_weight_oz'].isna().sum()}\n")
-
-def clean_dimensions(val):
-    """Boyut stringinden inches cinsinden (L, W, H) çıkarır."""
-    if pd.isna(val):
-        return np.nan, np.nan, np.nan
-    val = str(val).strip()
-    match = re.search(r"([\d.]+)\s*x\s*([\d.]+)\s*x\s*([\d.]+)", val, re.IGNORECASE)
-    if match:
-        try:
-            return float(match.group(1)), float(match.group(2)), float(match.group(3))
-        except ValueError:
-            return np.nan, np.nan, np.nan
-    match2 = re.search(r"([\d.]+)\s*x\s*([\d.]+)", val, re.IGNORECASE)
-    if match2:
-        try:
-            return float(match2.group(1)), float(match2.group(2)), np.nan
-        except ValueError:
-            return np.nan, np.nan, np.nan
-    return np.nan, np.nan, np.nan
-
-dims = df["product_dimensions"].apply(clean_dimensions)
-df["dim_length"] = dims.apply(lambda x: x[0])
-df["dim_width"] = dims.apply(lambda x: x[1])
-df["dim_height"] = dims.apply(lambda x: x[2])
-print(f"✅ Product dimensions ayrıştırıldı (L/W/H inches).\n")
+# Çıktı sütunları ve tipleri loaders.CLEANED_DTYPES'ta tanımlı
+OUTPUT_COLS = list(CLEANED_DTYPES)
+
+NUMERIC_COLS = ["selling_price", "list_price", "quantity", "shipping_weight_oz",
+                "discount_pct", "image_count"]
+
+
+def map_values(series, func):
+    """func'ı satır satır uygular; kategorik sütunlarda her kategori için yalnızca bir kez çağırır."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # codes == -1 (NaN) son elemana, yani func(NaN) sonucuna düşer
+        mapped = np.array([func(c) for c in series.cat.categories] + [func(np.nan)], dtype=object)
+        return pd.Series(mapped[series.cat.codes.to_numpy()], index=series.index, name=series.name)
+    return series.apply(func)
 
 def extract_main_category(val):
     if pd.isna(val):
@@ -182,11 +48,6 @@ def extract_sub_category(val):
         return parts[1].strip()
     return "Unknown"
 
-df["main_category"] = df["category"].apply(extract_main_category)
-df["sub_category"] = df["category"].apply(extract_sub_category)
-print(f"✅ Kategoriler ayrıştırıldı.")
-print(f"   Ana kategori dağılımı:\n{df['main_category'].value_counts().head(10)}\n")
-
 def clean_product_name(val):
     if pd.isna(val):
         return "Unknown"
@@ -195,12 +56,11 @@ def clean_product_name(val):
     val = re.sub(r"\s+", " ", val)
     return val if val else "Unknown"
 
-df["product_name"] = df["product_name"].apply(clean_product_name)
-print(f"✅ Ürün isimleri temizlendi.\n")
-
-df["brand"] = df["brand"].fillna("Unknown").astype(str).str.strip()
-df.loc[df["brand"].isin(["", "nan", "None"]), "brand"] = "Unknown"
-print(f"✅ Brand temizlendi. Unknown sayısı: {(df['brand'] == 'Unknown').sum()}\n")
+def clean_brand(val):
+    if pd.isna(val):
+        return "Unknown"
+    val = str(val).strip()
+    return "Unknown" if val in ["", "nan", "None"] else val
 
 def clean_boolean(val):
     if pd.isna(val):
@@ -208,44 +68,6 @@ def clean_boolean(val):
     val = str(val).strip().upper()
     return val in ["Y", "YES", "TRUE", "1"]
 
-df["is_amazon_seller"] = df["is_amazon_seller"].apply(clean_boolean)
-print(f"✅ is_amazon_seller boolean'a çevrildi. True: {df['is_amazon_seller'].sum()}\n")
-
-def count_images(val):
-    if pd.isna(val):
-        return 0
-    urls = str(val).split("|")
-    valid = [u for u in urls if "http" in u and "transparent-pixel" not in u]
-    return len(valid)
-
-df["image_count"] = df["image_urls"].apply(count_images)
-print(f"✅ Görsel sayısı hesaplandı. Ortalama: {df['image_count'].mean():.1f}\n")
-
-mask_swap = (df["selling_price"].notna() & df["list_price"].notna() & 
-             (df["selling_price"] > df["list_price"]))
-swap_count = mask_swap.sum()
-df.loc[mask_swap, ["selling_price", "list_price"]] = (
-    df.loc[mask_swap, ["list_price", "selling_price"]].values
-)
-print(f"✅ Fiyat tutarsızlıkları düzeltildi (selling > list swap): {swap_count}\n")
-
-mask_no_sell = df["selling_price"].isna() & df["list_price"].notna()
-df.loc[mask_no_sell, "selling_price"] = df.loc[mask_no_sell, "list_price"] * 0.85
-filled_sell = mask_no_sell.sum()
-
-mask_no_list = df["list_price"].isna() & df["selling_price"].notna()
-df.loc[mask_no_list, "list_price"] = df.loc[mask_no_list, "selling_price"] * 1.15
-filled_list = mask_no_list.sum()
-
-print(f"✅ Eksik fiyat tahmini yapıldı.")
-print(f"   selling_price doldurulan: {filled_sell}")
-print(f"   list_price doldurulan: {filled_list}\n")
-
-df["discount_amount"] = df["list_price"] - df["selling_price"]
-df["discount_pct"] = ((df["discount_amount"] / df["list_price"]) * 100).round(2)
-df.loc[df["discount_pct"] < 0, "discount_pct"] = 0.0
-print(f"✅ İndirim oranları hesaplandı. Ortalama indirim: %{df['discount_pct'].mean():.1f}\n")
-
 def clean_about_product(val):
     if pd.isna(val):
         return ""
@@ -254,60 +76,316 @@ def clean_about_product(val):
     val = val.lstrip("| ").strip()
     return val
 
-df["about_product"] = df["about_product"].apply(clean_about_product)
-print(f"✅ About product temizlendi.\n")
-
-print("=" * 60)
-print("📊 EKSİK VERİ ÖZETİ")
-print("=" * 60)
-missing = df.isnull().sum()
-missing_pct = (missing / len(df) * 100).round(1)
-missing_df = pd.DataFrame({"Eksik": missing, "Yüzde (%)": missing_pct})
-missing_df = missing_df[missing_df["Eksik"] > 0].sort_values("Yüzde (%)", ascending=False)
-print(missing_df.to_string())
-print()
-
-print("=" * 60)
-print("📊 SAYISAL SÜTUN İSTATİSTİKLERİ")
-print("=" * 60)
-numeric_cols = ["selling_price", "list_price", "quantity", "shipping_weight_oz",
-                "discount_pct", "image_count"]
-existing_numeric = [c for c in numeric_cols if c in df.columns]
-print(df[existing_numeric].describe().round(2).to_string())
-print()
-
-print("=" * 60)
-print("📊 AYKIRI DEĞER TESPİTİ (Fiyat)")
-print("=" * 60)
-for col in ["selling_price", "list_price"]:
-    if col in df.columns and df[col].notna().sum() > 0:
-        Q1 = df[col].quantile(0.25)
-        Q3 = df[col].quantile(0.75)
-        IQR = Q3 - Q1
-        lower = Q1 - 1.5 * IQR
-        upper = Q3 + 1.5 * IQR
-        outliers = ((df[col] < lower) | (df[col] > upper)).sum()
-        print(f"  {col}: Q1={Q1:.2f}, Q3={Q3:.2f}, IQR={IQR:.2f}")
-        print(f"    Alt sınır: {lower:.2f}, Üst sınır: {upper:.2f}")
-        print(f"    Aykırı değer sayısı: {outliers}")
-print()
-
-output_cols = [
-    "product_id", "product_name", "brand", "asin",
-    "main_category", "sub_category", "category",
-    "upc_ean_code", "list_price", "selling_price",
-    "discount_amount", "discount_pct",
-    "quantity", "model_number",
-    "about_product", "product_specification", "technical_details",
-    "shipping_weight_oz", "dim_length", "dim_width", "dim_height",
-    "image_urls", "image_count", "variants", "sku",
-    "product_url", "stock", "color",
-    "is_amazon_seller", "product_description"
-]
-output_cols = [c for c in output_cols if c in df.columns]
-df_out = df[output_cols]
-
-os.makedirs(os.path.dirname(OUTPUT_PATH) if os.path.dirname(OUTPUT_PATH) else ".", exist_ok=True)
-df_out.to_csv(OUTPUT_PATH, index=False)
-print(f"✅ Temizlenmiş veri kaydedildi: {OUTPUT_PATH}")
-print(f"   Son veri: {df_out.shape[0]} satır, {df_out.shape[1]} sütun")
\ No newline at end of file
+
+def clean_products(df, verbose=True, cache=None, timer=None):
+    """Tekilleştirilmiş ürün verisini temizler; batch ve streaming modu aynı adımları kullanır.
+
+    Metin ayrıştırıcıları her sütunun sadece farklı değerlerine uygulanır; cache (ParseCache)
+    verilirse önceki çalıştırmalarda ayrıştırılmış değerler diskten okunur. timer (StepTimer)
+    verilirse her adımın süresi onun üzerinde toplanır.
+    """
+    log = print if verbose else (lambda *args, **kwargs: None)
+    timer = timer or StepTimer()
+
+    with timer.step("prices", len(df)):
+        df["selling_price"] = parse_unique(df["selling_price"], parse_price, cache)
+        df["list_price"] = parse_unique(df["list_price"], parse_price, cache)
+
+    log(f"✅ Fiyat sütunları temizlendi.")
+    log(f"   selling_price NaN: {df['selling_price'].isna().sum()}")
+    log(f"   list_price NaN: {df['list_price'].isna().sum()}\n")
+
+    with timer.step("quantity", len(df)):
+        df["quantity"] = as_integral(parse_unique(df["quantity"], parse_quantity, cache))
+    log(f"✅ Quantity sütunu temizlendi. NaN: {df['quantity'].isna().sum()}\n")
+
+    with timer.step("shipping_weight", len(df)):
+        df["shipping_weight_oz"] = parse_unique(df["shipping_weight"], parse_weight, cache)
+    log(f"✅ Shipping weight sayısallaştırıldı (ounces). NaN: {df['shipping_weight_oz'].isna().sum()}\n")
+
+    with timer.step("dimensions", len(df)):
+        df[DIM_COLUMNS] = parse_unique(df["product_dimensions"], parse_dimensions, cache)
+        df["volumetric_weight_oz"] = volumetric_weight(df[DIM_COLUMNS])
+    log(f"✅ Product dimensions ayrıştırıldı (L/W/H inches, cm/mm çevrildi).")
+    log(f"   Hacimsel ağırlık hesaplanan ürün: {df['volumetric_weight_oz'].notna().sum()}\n")
+
+    with timer.step("categories", len(df)):
+        df["main_category"] = map_values(df["category"], extract_main_category)
+        df["sub_category"] = map_values(df["category"], extract_sub_category)
+    log(f"✅ Kategoriler ayrıştırıldı.")
+    log(f"   Ana kategori dağılımı:\n{df['main_category'].value_counts().head(10)}\n")
+
+    with timer.step("product_name", len(df)):
+        df["product_name"] = df["product_name"].apply(clean_product_name)
+    log(f"✅ Ürün isimleri temizlendi.\n")
+
+    with timer.step("brand", len(df)):
+        df["brand"] = map_values(df["brand"], clean_brand)
+    log(f"✅ Brand temizlendi. Unknown sayısı: {(df['brand'] == 'Unknown').sum()}\n")
+
+    with timer.step("is_amazon_seller", len(df)):
+        df["is_amazon_seller"] = df["is_amazon_seller"].apply(clean_boolean)
+    log(f"✅ is_amazon_seller boolean'a çevrildi. True: {df['is_amazon_seller'].sum()}\n")
+
+    with timer.step("image_count", len(df)):
+        # Domain dağılımı sadece ekrana yazılırken hesaplanır
+        images, domains = analyze_images(df["image_urls"], domains=verbose)
+        df[images.columns] = images
+    log(f"✅ Görsel sayısı hesaplandı. Ortalama: {df['image_count'].mean():.1f}")
+    log(f"   Yer tutucu görselli ürün: {df['has_placeholder_image'].sum()}")
+    if domains is not None:
+        log(f"   Görsel domainleri:\n{domains.head(5).to_string()}\n")
+
+    # Swap, tahmin ve indirim hesabı iki fiyat dizisi üzerinde tek kernel ile yapılır (ara DataFrame yok)
+    with timer.step("price_fix", len(df)):
+        selling = df["selling_price"].to_numpy(dtype=np.float64, copy=True)
+        list_price = df["list_price"].to_numpy(dtype=np.float64, copy=True)
+        discount_amount, discount_pct, swap_count, filled_sell, filled_list = fix_prices(selling, list_price)
+        df["selling_price"] = selling
+        df["list_price"] = list_price
+        df["discount_amount"] = discount_amount
+        df["discount_pct"] = discount_pct
+    log(f"✅ Fiyat tutarsızlıkları düzeltildi (selling > list swap): {swap_count}\n")
+
+    log(f"✅ Eksik fiyat tahmini yapıldı.")
+    log(f"   selling_price doldurulan: {filled_sell}")
+    log(f"   list_price doldurulan: {filled_list}\n")
+
+    log(f"✅ İndirim oranları hesaplandı. Ortalama indirim: %{df['discount_pct'].mean():.1f}\n")
+
+    with timer.step("about_product", len(df)):
+        df["about_product"] = df["about_product"].apply(clean_about_product)
+    log(f"✅ About product temizlendi.\n")
+    return df
+
+
+class SeenIds:
+    """Görülen product_id'lerin 64-bit hash'lerini sıralı bir uint64 dizisinde tutar (id başına 8 byte)."""
+
+    def __init__(self):
+        self.hashes = np.empty(0, dtype=np.uint64)
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def first_seen(self, ids):
+        """Daha önceki parçalarda ve bu parçada ilk kez görülen id'ler için True maskesi döndürür."""
+        h = pd.util.hash_pandas_object(ids, index=False).to_numpy()
+        keep = ~pd.Series(h).duplicated().to_numpy()
+        if len(self):
+            idx = np.minimum(np.searchsorted(self.hashes, h), len(self) - 1)
+            keep &= self.hashes[idx] != h
+        new = np.sort(h[keep])
+        self.hashes = np.insert(self.hashes, np.searchsorted(self.hashes, new), new)
+        return keep
+
+
+class NumericSummary:
+    """Sayısal sütunların özetini parça parça biriktirir; bellek sample_size ile sınırlıdır.
+
+    count/mean/std/min/max kesin tutulur (Chan birleştirmesi), çeyrekler ve aykırı değerler
+    sütun başına en fazla sample_size değerlik düzgün bir örneklemden hesaplanır.
+    Tüm değerler örnekleme sığıyorsa sonuçlar describe() ile birebir aynıdır.
+    """
+
+    def __init__(self, columns, sample_size=100_000, seed=0):
+        self.columns = list(columns)
+        self.sample_size = sample_size
+        self.rng = np.random.default_rng(seed)
+        self.n = {c: 0 for c in self.columns}
+        self.mean = {c: 0.0 for c in self.columns}
+        self.m2 = {c: 0.0 for c in self.columns}
+        self.min = {c: np.nan for c in self.columns}
+        self.max = {c: np.nan for c in self.columns}
+        # Her değere rastgele bir anahtar verilir; en küçük sample_size anahtarlı değerler saklanır
+        self.sample = {c: np.empty(0) for c in self.columns}
+        self.keys = {c: np.empty(0) for c in self.columns}
+
+    def update(self, df):
+        for c in self.columns:
+            if c not in df.columns:
+                continue
+            x = df[c].to_numpy(dtype=np.float64, na_value=np.nan)
+            x = x[~np.isnan(x)]
+            if not len(x):
+                continue
+            n, mean, m2 = len(x), x.mean(), ((x - x.mean()) ** 2).sum()
+            total = self.n[c] + n
+            delta = mean - self.mean[c]
+            self.m2[c] += m2 + delta ** 2 * self.n[c] * n / total
+            self.mean[c] += delta * n / total
+            self.n[c] = total
+            self.min[c] = np.fmin(self.min[c], x.min())
+            self.max[c] = np.fmax(self.max[c], x.max())
+
+            sample = np.concatenate([self.sample[c], x])
+            keys = np.concatenate([self.keys[c], self.rng.random(n)])
+            if len(sample) > self.sample_size:
+                keep = np.argpartition(keys, self.sample_size)[:self.sample_size]
+                sample, keys = sample[keep], keys[keep]
+            self.sample[c], self.keys[c] = sample, keys
+
+    def exact(self, col):
+        return self.n[col] == len(self.sample[col])
+
+    def quantile(self, col, q):
+        return pd.Series(self.sample[col]).quantile(q) if len(self.sample[col]) else np.nan
+
+    def describe(self):
+        rows = {}
+        for c in self.columns:
+            n = self.n[c]
+            rows[c] = [n, self.mean[c] if n else np.nan, np.sqrt(self.m2[c] / (n - 1)) if n > 1 else np.nan,
+                       self.min[c]] + [self.quantile(c, q) for q in (0.25, 0.5, 0.75)] + [self.max[c]]
+        return pd.DataFrame(rows, index=["count", "mean", "std", "min", "25%", "50%", "75%", "max"])
+
+    def outliers(self, col, lower, upper):
+        """[lower, upper] dışındaki değer sayısı; örneklem eksikse tüm sütuna ölçeklenmiş tahmindir."""
+        sample = self.sample[col]
+        count = int(((sample < lower) | (sample > upper)).sum())
+        return count if self.exact(col) else round(count / len(sample) * self.n[col])
+
+
+def print_summary(missing, n_rows, numeric):
+    print("=" * 60)
+    print("📊 EKSİK VERİ ÖZETİ")
+    print("=" * 60)
+    missing_pct = (missing / n_rows * 100).round(1)
+    missing_df = pd.DataFrame({"Eksik": missing, "Yüzde (%)": missing_pct})
+    missing_df = missing_df[missing_df["Eksik"] > 0].sort_values("Yüzde (%)", ascending=False)
+    print(missing_df.to_string())
+    print()
+
+    print("=" * 60)
+    print("📊 SAYISAL SÜTUN İSTATİSTİKLERİ")
+    print("=" * 60)
+    print(numeric.describe().round(2).to_string())
+    print()
+
+    print("=" * 60)
+    print("📊 AYKIRI DEĞER TESPİTİ (Fiyat)")
+    print("=" * 60)
+    for col in ["selling_price", "list_price"]:
+        if col in numeric.columns and numeric.n[col] > 0:
+            Q1 = numeric.quantile(col, 0.25)
+            Q3 = numeric.quantile(col, 0.75)
+            IQR = Q3 - Q1
+            lower = Q1 - 1.5 * IQR
+            upper = Q3 + 1.5 * IQR
+            outliers = numeric.outliers(col, lower, upper)
+            print(f"  {col}: Q1={Q1:.2f}, Q3={Q3:.2f}, IQR={IQR:.2f}")
+            print(f"    Alt sınır: {lower:.2f}, Üst sınır: {upper:.2f}")
+            if numeric.exact(col):
+                print(f"    Aykırı değer sayısı: {outliers}")
+            else:
+                print(f"    Aykırı değer sayısı: ~{outliers} ({len(numeric.sample[col])} değerlik örneklemden)")
+    print()
+
+
+def print_saved():
+    print(f"✅ Temizlenmiş veri kaydedildi: {CLEANED_CSV_PATH}")
+    if pq is not None:
+        print(f"✅ Tipli Parquet artefaktı kaydedildi: {CLEANED_PATH}")
+
+
+def print_cache(cache):
+    if cache is not None:
+        print(f"♻️  Ayrıştırma önbelleği: {cache.hits} değer diskten okundu, {cache.misses} değer ayrıştırıldı")
+
+
+def run_batch(cache=None, timer=None, workers=1):
+    timer = timer or StepTimer()
+    with timer.step("read") as step:
+        df = read_products(CLEANING_COLUMNS)
+        step["rows_out"] = len(df)
+    print(f"Orijinal veri: {df.shape[0]} satır, {df.shape[1]} sütun")
+    print(f"Sütunlar: {df.columns.tolist()}\n")
+
+    with timer.step("dedup", len(df)) as step:
+        dup_count_before = df.duplicated().sum()
+        df.drop_duplicates(inplace=True)
+        dup_id_before = df.duplicated(subset=["product_id"]).sum()
+        df.drop_duplicates(subset=["product_id"], keep="first", inplace=True)
+        df.reset_index(drop=True, inplace=True)
+        step["rows_out"] = len(df)
+    print(f"✅ Tam tekrar eden satır kaldırıldı: {dup_count_before}")
+    print(f"✅ Aynı product_id'ye sahip tekrar eden satır kaldırıldı: {dup_id_before}\n")
+
+    if workers > 1 and len(df):
+        # Satır aralıkları ayrı süreçlerde temizlenir; adım adım ara çıktılar basılmaz
+        print(f"⚙️  Paralel temizleme: {workers} süreç")
+        df = clean_parallel(df, workers, timer)
+        print(f"✅ {len(df)} satır temizlendi.\n")
+    else:
+        df = clean_products(df, cache=cache, timer=timer)
+
+    # Tek parçada tüm değerler örneklemde tutulur, yani özet kesindir
+    numeric = NumericSummary([c for c in NUMERIC_COLS if c in df.columns], sample_size=max(len(df), 1))
+    numeric.update(df)
+    print_summary(df.isnull().sum(), len(df), numeric)
+
+    df_out = df[OUTPUT_COLS]
+    with timer.step("write", len(df_out)), CleanedWriter(workers=workers) as writer:
+        writer.write(df_out)
+    print_saved()
+    print_cache(cache)
+    print(f"   Son veri: {df_out.shape[0]} satır, {df_out.shape[1]} sütun")
+
+
+def run_streaming(chunk_size, cache=None, timer=None):
+    """Dosyayı chunk_size'lık parçalarla okur, temizler ve çıktıya ekler; bellek parça boyutuyla sınırlı kalır."""
+    timer = timer or StepTimer()
+    seen = SeenIds()
+    rows_in = rows_out = 0
+    missing = None
+    numeric = NumericSummary(NUMERIC_COLS)
+
+    with CleanedWriter() as writer:
+        for i, chunk in enumerate(timer.iterate("read", read_products(CLEANING_COLUMNS, chunksize=chunk_size))):
+            rows_in += len(chunk)
+            with timer.step("dedup", len(chunk)) as step:
+                chunk = chunk[seen.first_seen(chunk["product_id"])].copy()
+                step["rows_out"] = len(chunk)
+            chunk = clean_products(chunk, verbose=False, cache=cache, timer=timer)
+
+            chunk_missing = chunk.isnull().sum()
+            missing = chunk_missing if missing is None else missing.add(chunk_missing, fill_value=0)
+            numeric.update(chunk)
+
+            chunk_out = chunk[OUTPUT_COLS]
+            with timer.step("write", len(chunk_out)):
+                writer.write(chunk_out)
+            rows_out += len(chunk_out)
+            print(f"   Parça {i + 1}: {len(chunk_out)} satır yazıldı (toplam {rows_out})")
+
+    print(f"\n✅ Okunan satır: {rows_in}")
+    print(f"✅ Tekrar eden product_id satırı kaldırıldı: {rows_in - rows_out}\n")
+    if rows_out:
+        print_summary(missing.astype(int), rows_out, numeric)
+    print_saved()
+    print_cache(cache)
+    print(f"   Son veri: {rows_out} satır")
+
+
+if __name__ == "__main__":
+    # Kullanım: python data_cleaning.py [--chunksize N | --workers N] [--parse-cache] [--profile ADIM]
+    # --parse-cache ayrıştırılmış değerleri data/.parse_cache.sqlite'ta çalıştırmalar arasında saklar;
+    # --workers katalog satırlarını N sürece bölerek temizler (önbellek bu modda kullanılmaz);
+    # --profile verilen adımı (ör. prices, dimensions) cProfile ile ölçer
+    if "--chunksize" in sys.argv and "--workers" in sys.argv:
+        print("--chunksize ve --workers birlikte kullanılamaz: parçalı mod tek süreçte çalışır.")
+        sys.exit(1)
+    cache = ParseCache() if "--parse-cache" in sys.argv else None
+    timer = StepTimer(sys.argv[sys.argv.index("--profile") + 1] if "--profile" in sys.argv else None)
+    workers = int(sys.argv[sys.argv.index("--workers") + 1]) if "--workers" in sys.argv else 1
+    try:
+        if "--chunksize" in sys.argv:
+            run_streaming(int(sys.argv[sys.argv.index("--chunksize") + 1]), cache, timer)
+        else:
+            run_batch(cache, timer, workers)
+    finally:
+        if cache is not None:
+            cache.close()
+    timer.print_report()
+    report = timer.write_report("data_cleaning")
+    print(f"📄 Adım raporu: {report}.json, {report}.csv")
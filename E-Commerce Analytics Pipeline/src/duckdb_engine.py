@@ -0,0 +1,100 @@
+import os
+import re
+
+try:
+    import duckdb
+except ImportError:  # isteğe bağlı motor; kurulu değilse pandas yolu kullanılır
+    duckdb = None
+
+from loaders import SALES_COLUMNS, SALES_PATH
+from parsers import TIMESTAMP_FORMATS
+from weekly_store import KEYS
+
+# Bellek yetmezse DuckDB ara sonuçları buraya taşır
+TEMP_DIR = "data/.duckdb_tmp"
+# --memory-limit SQL'e metin olarak girer; yalnızca "2GB", "512 MiB" gibi boyutlar kabul edilir
+MEMORY_LIMIT_PATTERN = re.compile(r"\d+(\.\d+)?\s*([KMGT]i?B|B|bytes)", re.IGNORECASE)
+# pandas yolu formata uymayan satırları format="mixed", dayfirst=True ile çözer; SQL'de aynı sonucu
+# veren yazımlar. dayfirst yıl önce gelen tarihleri de yıl-gün-ay okur ("2023-10-12" -> 10 Aralık);
+# gün 12'yi aşınca yıl-ay-gün kalır, onu sorgudaki TRY_CAST çözer
+FALLBACK_FORMATS = [
+    fmt.replace("%d/%m/%Y", date)
+    for date in ("%d-%m-%Y", "%d.%m.%Y", "%Y-%d-%m", "%Y/%d/%m")
+    for fmt in TIMESTAMP_FORMATS
+]
+FALLBACK_FORMATS += [fmt.replace(" ", "T") for fmt in FALLBACK_FORMATS if fmt.startswith("%Y-%d-%m ")]
+
+WEEKLY_COUNTS_SQL = """
+WITH events AS (
+    SELECT
+        product_id,
+        trim(interaction_type) AS interaction_type,
+        coalesce(
+            try_strptime("timestamp", $formats),
+            try_strptime("timestamp", $fallback_formats),
+            try_cast("timestamp" AS TIMESTAMP)
+        ) AS ts
+    FROM read_csv($path, header = true, all_varchar = true, names = $names)
+    WHERE trim(interaction_type) <> ''
+)
+SELECT
+    date_trunc('week', ts) AS week_start,
+    product_id,
+    interaction_type,
+    count(*) AS count,
+    min(ts) AS first_ts,
+    max(ts) AS last_ts
+FROM events
+GROUP BY ALL
+"""
+
+
+def weekly_counts(path=SALES_PATH, memory_limit=None):
+    """Etkileşim logunu DuckDB ile tarar; WeeklyStore.counts() ile aynı tabloyu üretir.
+
+    Dosya belleğe alınmaz: tek paralel taramada boş satırlar elenir ve gruplama bellek sınırını
+    aşarsa TEMP_DIR'e taşar. (sayımlar, (ilk, son) zaman damgası, ayrıştırılamayan
+    satır sayısı) döner.
+    """
+    if duckdb is None:
+        raise ImportError("DuckDB motoru için 'pip install duckdb' gerekli.")
+    if memory_limit and not MEMORY_LIMIT_PATTERN.fullmatch(memory_limit):
+        raise ValueError(f"Geçersiz bellek sınırı: {memory_limit!r} (örnek: 2GB, 512MiB)")
+    os.makedirs(TEMP_DIR, exist_ok=True)
+    con = duckdb.connect()
+    con.execute(f"SET temp_directory = '{TEMP_DIR}'")
+    con.execute("SET preserve_insertion_order = false")  # sıra sonradan KEYS ile verilir
+    con.execute("SET enable_progress_bar = false")
+    if memory_limit:
+        con.execute(f"SET memory_limit = '{memory_limit}'")
+    params = {"path": path, "names": SALES_COLUMNS, "formats": TIMESTAMP_FORMATS,
+              "fallback_formats": FALLBACK_FORMATS}
+    counts = con.execute(WEEKLY_COUNTS_SQL, params).df()
+    con.close()
+
+    # Zaman damgası boş ya da hiçbir yazıma uymayan satırlar week_start'ı boş grupta toplanır
+    bad = counts["week_start"].isna()
+    unparsed = int(counts.loc[bad, "count"].sum())
+    counts = counts[~bad]
+    period = (counts["first_ts"].min(), counts["last_ts"].max())
+    counts = counts[KEYS + ["count"]].sort_values(KEYS, ignore_index=True)
+    counts["week_start"] = counts["week_start"].astype("datetime64[ns]")
+    counts["count"] = counts["count"].astype("int64")
+    return counts, period, unparsed
+
+
+def validate(counts, reference):
+    """İki motorun sayım tablolarını karşılaştırır; farklı satır sayısını döndürür (0 = aynı).
+
+    DuckDB'nin ayrıştıramadığı satırlar tablodan çıkıp unparsed'a sayılır; pandas yolunda boş zaman
+    damgaları NaT haftasında toplandığından bu grup karşılaştırmaya alınmaz. FALLBACK_FORMATS dışında
+    kalıp sadece pandas'ın format="mixed" ile çözebildiği yazımlar (ay adları, AM/PM, kesirli saniye
+    gibi) farklı satır olarak görünür.
+    """
+    reference = reference[reference["week_start"].notna()]
+    merged = (
+        counts.groupby(KEYS, dropna=False)["count"].sum().rename("engine").to_frame()
+        .join(reference.groupby(KEYS, dropna=False)["count"].sum().rename("reference"), how="outer")
+        .fillna(0)
+    )
+    return int((merged["engine"] != merged["reference"]).sum())
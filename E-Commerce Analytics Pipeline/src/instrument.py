@@ -0,0 +1,128 @@
+import cProfile
+import csv
+import json
+import os
+import pstats
+import time
+from contextlib import contextmanager
+
+try:
+    import psutil
+except ImportError:  # psutil yoksa Linux'ta /proc okunur, diğer sistemlerde bellek boş bırakılır
+    psutil = None
+
+REPORT_DIR = "data/processed/reports"
+FIELDS = ["step", "calls", "wall_s", "cpu_s", "rows_in", "rows_out", "rows_per_s", "rss_delta_mb", "rss_mb"]
+
+
+def rss_bytes():
+    """Sürecin o anki resident bellek kullanımı (byte); ölçülemiyorsa None."""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class StepTimer:
+    """Adım başına duvar saati, CPU süresi, satır sayısı ve RSS değişimini toplar.
+
+    Aynı isimle tekrar çalışan adımlar (streaming parçaları) tek satırda birikir. profile_step
+    verilirse o adım cProfile altında çalışır ve rapor yazılırken .prof dosyası da bırakılır.
+    """
+
+    def __init__(self, profile_step=None):
+        self.steps = {}
+        self.profile_step = profile_step
+        self.profiler = cProfile.Profile() if profile_step else None
+        self.started = time.perf_counter()
+
+    @contextmanager
+    def step(self, name, rows=None):
+        """Bloğu ölçer; verilen sözlükteki rows_out güncellenirse çıkan satır sayısı o olur."""
+        info = {"rows_out": rows}
+        rss = rss_bytes()
+        wall, cpu = time.perf_counter(), time.process_time()
+        profiled = self.profiler is not None and name == self.profile_step
+        if profiled:
+            self.profiler.enable()
+        try:
+            yield info
+        finally:
+            if profiled:
+                self.profiler.disable()
+            end_rss = rss_bytes()
+            rec = self.steps.setdefault(name, {
+                "step": name, "calls": 0, "wall_s": 0.0, "cpu_s": 0.0,
+                "rows_in": 0, "rows_out": 0, "rss_delta_mb": 0.0, "rss_mb": None,
+            })
+            rec["calls"] += 1
+            rec["wall_s"] += time.perf_counter() - wall
+            rec["cpu_s"] += time.process_time() - cpu
+            rec["rows_in"] += rows or 0
+            rec["rows_out"] += info["rows_out"] or 0
+            if rss is not None and end_rss is not None:
+                rec["rss_delta_mb"] += (end_rss - rss) / 2 ** 20
+                rec["rss_mb"] = end_rss / 2 ** 20
+
+    def merge(self, steps):
+        """Başka bir StepTimer'ın (ör. alt süreçteki) adım kayıtlarını bu kayıtlara ekler."""
+        for name, other in steps.items():
+            rec = self.steps.setdefault(name, dict(other, calls=0, wall_s=0.0, cpu_s=0.0, rows_in=0,
+                                                   rows_out=0, rss_delta_mb=0.0))
+            for key in ("calls", "wall_s", "cpu_s", "rows_in", "rows_out", "rss_delta_mb"):
+                rec[key] += other[key]
+            rec["rss_mb"] = other["rss_mb"]
+
+    def iterate(self, name, items):
+        """items'ı dolaşır; her elemanın (ör. okunan parçanın) üretilme süresini name adımına yazar."""
+        items = iter(items)
+        while True:
+            with self.step(name) as info:
+                item = next(items, None)
+                info["rows_out"] = len(item) if item is not None else 0
+            if item is None:
+                return
+            yield item
+
+    def records(self):
+        rows = []
+        for rec in self.steps.values():
+            # Okuma gibi girdisi olmayan adımlarda hız üretilen satırdan hesaplanır
+            rows_done = rec["rows_in"] or rec["rows_out"]
+            rec = dict(rec, rows_per_s=rows_done / rec["wall_s"] if rec["wall_s"] > 0 else None)
+            rows.append({k: round(rec[k], 4) if isinstance(rec[k], float) else rec[k] for k in FIELDS})
+        return rows
+
+    def print_report(self):
+        print("=" * 60)
+        print("⏱  ADIM SÜRELERİ")
+        print("=" * 60)
+        print(f"{'adım':<22}{'süre (s)':>10}{'cpu (s)':>10}{'satır/s':>12}{'Δ RSS (MB)':>12}")
+        for rec in self.records():
+            speed = f"{rec['rows_per_s']:,.0f}" if rec["rows_per_s"] else "-"
+            print(f"{rec['step']:<22}{rec['wall_s']:>10.3f}{rec['cpu_s']:>10.3f}{speed:>12}"
+                  f"{rec['rss_delta_mb']:>12.1f}")
+        print(f"Toplam süre: {time.perf_counter() - self.started:.2f} s\n")
+
+    def write_report(self, name, directory=REPORT_DIR):
+        """Adım kayıtlarını <name>.json ve <name>.csv olarak yazar; profil varsa <name>.prof bırakır."""
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, name)
+        records = self.records()
+        with open(base + ".json", "w", encoding="utf-8") as f:
+            json.dump({
+                "total_wall_s": round(time.perf_counter() - self.started, 4),
+                "steps": records,
+            }, f, indent=1, ensure_ascii=False)
+        with open(base + ".csv", "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(records)
+        if self.profiler is not None and self.profile_step in self.steps:
+            self.profiler.dump_stats(base + ".prof")
+            print(f"🔍 '{self.profile_step}' adımının profili ({base}.prof), en pahalı 15 çağrı:")
+            pstats.Stats(self.profiler).sort_stats("cumulative").print_stats(15)
+        return base
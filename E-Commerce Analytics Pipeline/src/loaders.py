@@ -0,0 +1,269 @@
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    ENGINE = "pyarrow"
+except ImportError:  # pyarrow yoksa pandas'ın C motoru kullanılır, Parquet artefaktı yazılmaz
+    pa = pq = None
+    ENGINE = "c"
+
+PRODUCT_PATH = "data/product_details.csv"
+SALES_PATH = "data/E-commerece sales data 2024.csv"
+CLEANED_CSV_PATH = "data/cleaned_product_details.csv"
+CLEANED_PATH = "data/cleaned_product_details.parquet"
+
+# Ham ürün dosyası sütun adı -> pipeline içindeki standart ad
+PRODUCT_COLUMNS = {
+    "Uniqe Id": "product_id",
+    "Product Name": "product_name",
+    "Brand Name": "brand",
+    "Asin": "asin",
+    "Category": "category",
+    "Upc Ean Code": "upc_ean_code",
+    "List Price": "list_price",
+    "Selling Price": "selling_price",
+    "Quantity": "quantity",
+    "Model Number": "model_number",
+    "About Product": "about_product",
+    "Product Specification": "product_specification",
+    "Technical Details": "technical_details",
+    "Shipping Weight": "shipping_weight",
+    "Product Dimensions": "product_dimensions",
+    "Image": "image_urls",
+    "Variants": "variants",
+    "Sku": "sku",
+    "Product Url": "product_url",
+    "Stock": "stock",
+    "Product Details": "product_details",
+    "Dimensions": "dimensions",
+    "Color": "color",
+    "Ingredients": "ingredients",
+    "Direction To Use": "direction_to_use",
+    "Is Amazon Seller": "is_amazon_seller",
+    "Size Quantity Variant": "size_quantity_variant",
+    "Product Description": "product_description",
+}
+
+# Etkileşim dosyasının başlığı sonda boş bir sütun içerir ("...,Time stamp,")
+SALES_COLUMNS = ["user_id", "product_id", "interaction_type", "timestamp", "extra"]
+
+# Aşamaların okuduğu sütunlar (standart adlarla)
+CLEANING_COLUMNS = [
+    "product_id", "product_name", "brand", "asin", "category", "upc_ean_code",
+    "list_price", "selling_price", "quantity", "model_number",
+    "about_product", "product_specification", "technical_details",
+    "shipping_weight", "product_dimensions", "image_urls", "variants", "sku",
+    "product_url", "stock", "color", "is_amazon_seller", "product_description",
+]
+ANALYSIS_COLUMNS = ["product_id", "product_name", "category", "selling_price", "list_price"]
+INTERACTION_COLUMNS = ["user_id", "product_id", "interaction_type", "timestamp"]
+
+# Düşük kardinaliteli metin sütunları kategorik okunur
+DTYPES = {
+    "brand": "category",
+    "category": "category",
+    "interaction_type": "category",
+}
+
+# Temizleme aşamasının çıktı şeması; sonraki aşamalar bu tiplerle okur
+CLEANED_DTYPES = {
+    "product_id": "string",
+    "product_name": "string",
+    "brand": "category",
+    "asin": "string",
+    "main_category": "category",
+    "sub_category": "category",
+    "category": "category",
+    "upc_ean_code": "string",
+    "list_price": "float64",
+    "selling_price": "float64",
+    "discount_amount": "float64",
+    "discount_pct": "float64",
+    "quantity": "float64",
+    "model_number": "string",
+    "about_product": "string",
+    "product_specification": "string",
+    "technical_details": "string",
+    "shipping_weight_oz": "float64",
+    "dim_length": "float64",
+    "dim_width": "float64",
+    "dim_height": "float64",
+    "volumetric_weight_oz": "float64",
+    "image_urls": "string",
+    "image_count": "int64",
+    "first_image_url": "string",
+    "has_placeholder_image": "bool",
+    "variants": "string",
+    "sku": "string",
+    "product_url": "string",
+    "stock": "string",
+    "color": "string",
+    "is_amazon_seller": "bool",
+    "product_description": "string",
+}
+
+
+def _read_csv(path, **kwargs):
+    """pyarrow motoru varsa onunla okur; desteklemediği bir durumda C motoruna düşer."""
+    if ENGINE == "pyarrow" and "chunksize" not in kwargs:
+        try:
+            return pd.read_csv(path, engine="pyarrow", **kwargs)
+        except (ValueError, TypeError, pa.ArrowException):
+            if hasattr(path, "seek"):
+                path.seek(0)
+    return pd.read_csv(path, **kwargs)
+
+
+def strip_categories(series):
+    """Kategori etiketlerindeki boşlukları temizler; temizlendikten sonra çakışan etiketler birleşir."""
+    # Sadece boş satırlardan oluşan bir parçada kategori listesi boş ve sayısal tiplidir
+    stripped = series.cat.categories.astype(str).str.strip()
+    categories = pd.Index(stripped.unique())
+    mapping = categories.get_indexer(stripped)
+    codes = series.cat.codes.to_numpy()
+    # -1 (NaN) kodları sona eklenen -1'e düşer; hiç kategori yoksa da çalışır
+    codes = np.append(mapping, -1)[codes]
+    return pd.Series(pd.Categorical.from_codes(codes, categories), index=series.index, name=series.name)
+
+
+def read_products(columns, path=PRODUCT_PATH, chunksize=None):
+    """Ürün dosyasından sadece istenen sütunları tip haritasıyla okur; sütunlar standart adlarla döner.
+
+    chunksize verilirse parçaları döndüren bir iterator döner.
+    """
+    raw_names = {std: raw for raw, std in PRODUCT_COLUMNS.items()}
+    usecols = [raw_names[col] for col in columns]
+    dtype = {raw_names[col]: DTYPES[col] for col in columns if col in DTYPES}
+    if chunksize:
+        reader = pd.read_csv(path, usecols=usecols, dtype=dtype, chunksize=chunksize)
+        return (chunk.rename(columns=PRODUCT_COLUMNS) for chunk in reader)
+    return _read_csv(path, usecols=usecols, dtype=dtype).rename(columns=PRODUCT_COLUMNS)
+
+
+def read_interactions(path=SALES_PATH):
+    """Etkileşim loglarını okur; interaction_type kategorik ve boşlukları temizlenmiş döner."""
+    return _interactions(path, header=0)
+
+
+def read_interactions_from(offset, path=SALES_PATH):
+    """Etkileşim dosyasını offset baytından itibaren okur; (DataFrame, yeni offset, son satır) döner.
+
+    Yeni offset son satır sonunu gösterir. Dosya satır sonu olmadan bitiyorsa son satır ayrı bir
+    DataFrame olarak döner ama offset'e katılmaz: dosyaya hâlâ yazılıyor olabilir, bir sonraki okumada
+    tamamıyla yeniden okunur. offset 0 ise başlık satırı atlanır.
+    """
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    end = data.rfind(b"\n") + 1
+    header = 0 if offset == 0 else None
+    df = _interactions_bytes(data[:end], header)
+    # Dosyada hiç satır sonu yoksa kalan tek satır başlıktır
+    tail = _interactions_bytes(data[end:], 0 if offset + end == 0 else None)
+    return df, offset + end, tail
+
+
+def _interactions_bytes(data, header):
+    if not data.strip():
+        return pd.DataFrame(columns=INTERACTION_COLUMNS)
+    return _interactions(io.BytesIO(data), header=header)
+
+
+def _interactions(source, header):
+    dtype = {col: DTYPES[col] for col in INTERACTION_COLUMNS if col in DTYPES}
+    df = _read_csv(source, header=header, names=SALES_COLUMNS, dtype=dtype)
+    df = df[INTERACTION_COLUMNS]
+    df["interaction_type"] = strip_categories(df["interaction_type"])
+    return df
+
+
+def _cleaned_schema():
+    """CLEANED_DTYPES'ın Arrow karşılığı; kategoriler sözlük (dictionary) olarak saklanır."""
+    types = {
+        "string": pa.string(),
+        "category": pa.dictionary(pa.int32(), pa.string()),
+        "float64": pa.float64(),
+        "int64": pa.int64(),
+        "bool": pa.bool_(),
+    }
+    return pa.schema([(col, types[dtype]) for col, dtype in CLEANED_DTYPES.items()])
+
+
+def _csv_text(df, header):
+    return df.to_csv(index=False, header=header)
+
+
+class CleanedWriter:
+    """Temizlenmiş veriyi CSV'ye ve pyarrow varsa tipli Parquet artefaktına parça parça yazar.
+
+    İki çıktı da CLEANED_DTYPES tipleriyle yazılır; böylece toplu, parçalı ve paralel çalıştırmalar
+    (ör. quantity'nin "3" ya da "3.0" yazılması) aynı dosyayı üretir. workers > 1 ise CSV metni
+    satır blokları halinde ayrı süreçlerde üretilip sırayla eklenir; alanlar birbirinden bağımsız
+    biçimlendiği için dosya tek süreçte yazılanla aynıdır.
+    """
+
+    def __init__(self, csv_path=CLEANED_CSV_PATH, parquet_path=CLEANED_PATH, workers=1):
+        self.csv_path = csv_path
+        self.parquet_path = parquet_path
+        self.workers = workers
+        self.rows = 0
+        self._written = False
+        self._parquet = None
+        os.makedirs(os.path.dirname(csv_path) or ".", exist_ok=True)
+        if pq is None and os.path.exists(parquet_path):
+            os.remove(parquet_path)  # eski artefakt yeni CSV'den farklı olabilir
+
+    def write(self, df):
+        df = df[list(CLEANED_DTYPES)].astype(CLEANED_DTYPES)
+        if self.workers > 1 and len(df) >= self.workers:
+            bounds = np.linspace(0, len(df), self.workers + 1).astype(int)
+            blocks = [df.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+            headers = [not self.rows] + [False] * (len(blocks) - 1)
+            # Parquet yazıcısı iş parçacığı başlatmış olabilir; fork yerine spawn kullanılır
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=self.workers, mp_context=context) as pool:
+                texts = list(pool.map(_csv_text, blocks, headers))
+            with open(self.csv_path, "a" if self.rows else "w", newline="", encoding="utf-8") as f:
+                f.writelines(texts)
+        else:
+            df.to_csv(self.csv_path, mode="a" if self.rows else "w", header=not self.rows, index=False)
+        if pq is not None:
+            table = pa.Table.from_pandas(df, schema=_cleaned_schema(), preserve_index=False)
+            if self._parquet is None:
+                self._parquet = pq.ParquetWriter(self.parquet_path, table.schema)
+            self._parquet.write_table(table)
+        self.rows += len(df)
+        self._written = True
+
+    def close(self):
+        # Hiç parça gelmediyse önceki çalıştırmanın dosyaları kalmasın: başlıklı boş CSV ve
+        # şemalı boş Parquet yazılır
+        if not self._written:
+            self.write(pd.DataFrame(columns=list(CLEANED_DTYPES)))
+        if self._parquet is not None:
+            self._parquet.close()
+            self._parquet = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_cleaned(columns):
+    """Temizlenmiş ürün verisinden sadece istenen sütunları okur.
+
+    Parquet artefaktı varsa sütun projeksiyonuyla (memory-map) okunur, yoksa CSV'ye düşülür.
+    """
+    if pq is not None and os.path.exists(CLEANED_PATH):
+        return pq.read_table(CLEANED_PATH, columns=columns, memory_map=True).to_pandas()
+    dtype = {col: CLEANED_DTYPES[col] for col in columns}
+    return _read_csv(CLEANED_CSV_PATH, usecols=columns, dtype=dtype)
@@ -1,25 +1,56 @@
-import subprocess
 import sys
 import os
 
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
-scripts = [
-    ("data_cleaning.py",          "Data Cleaning"),
-    ("weekly_sales_analysis.py",  "Weekly Sales Analysis"),
+from loaders import CLEANED_CSV_PATH, CLEANED_PATH, PRODUCT_PATH, SALES_PATH, pq
+from pipeline import Stage, run_pipeline
+from profitability_analysis import OUTPUT_PATHS as PROFITABILITY_OUTPUTS
+from weekly_store import STATE_PATH as STORE_STATE
+
+# Parquet artefaktı sadece pyarrow kuruluyken üretilir
+CLEANED_OUTPUTS = [CLEANED_CSV_PATH] + ([CLEANED_PATH] if pq is not None else [])
+
+
+def forward(options=(), switches=()):
+    """main.py'ye verilen seçeneklerden (değerleriyle) ve bayraklardan bir adıma iletilecek olanlar."""
+    args = []
+    for option in options:
+        if option in sys.argv:
+            args += [option, sys.argv[sys.argv.index(option) + 1]]
+    return args + [switch for switch in switches if switch in sys.argv]
+
+
+stages = [
+    Stage("Data Cleaning", "data_cleaning.py",
+          inputs=[PRODUCT_PATH],
+          outputs=CLEANED_OUTPUTS,
+          args=forward(["--chunksize", "--workers", "--profile"], ["--parse-cache"])),
+    # Haftalık depoyu sadece bu adım yazar; analiz adımları state.json üzerinden ona bağlıdır
+    Stage("Weekly Store Update", "weekly_store.py",
+          inputs=[SALES_PATH],
+          outputs=[STORE_STATE],
+          args=forward(switches=["--rebuild"])),
+    Stage("Weekly Sales Analysis", "weekly_sales_analysis.py",
+          inputs=[SALES_PATH, STORE_STATE] + CLEANED_OUTPUTS,
+          outputs=["data/processed/weekly_sales_analysis.png"],
+          args=forward(["--top", "--engine", "--memory-limit"], ["--validate"])),
+    Stage("Profitability Analysis", "profitability_analysis.py",
+          inputs=[STORE_STATE] + CLEANED_OUTPUTS,
+          outputs=PROFITABILITY_OUTPUTS),
 ]
 
-for script, label in scripts:
-    print("=" * 60)
-    print(f"▶ {label}  ({script})")
-    print("=" * 60)
-    result = subprocess.run([sys.executable, script], capture_output=False)
-    if result.returncode != 0:
-        print(f"\n❌ {script} hata ile sonlandı (return code: {result.returncode})")
+if __name__ == "__main__":
+    # Kullanım: python main.py [--force] [temizleme ve analiz seçenekleri]
+    # --force önbelleği yok sayar; --chunksize, --workers, --profile, --parse-cache temizleme adımına,
+    # --rebuild haftalık depo adımına, --top, --engine, --memory-limit, --validate haftalık analiz adımına iletilir.
+    # Argümanlar adımın önbellek anahtarına girer; farklı seçeneklerle adım yeniden çalışır
+    status = run_pipeline(stages, force="--force" in sys.argv)
+
+    if "failed" in status.values():
         print("Sonraki scriptler çalıştırılmayacak.")
-        sys.exit(result.returncode)
-    print()
+        sys.exit(1)
 
-print("=" * 60)
-print("✅ Tüm scriptler başarıyla tamamlandı.")
-print("=" * 60)
\ No newline at end of file
+    print("=" * 60)
+    print("✅ Tüm scriptler başarıyla tamamlandı.")
+    print("=" * 60)
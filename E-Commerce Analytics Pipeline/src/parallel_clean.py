@@ -0,0 +1,98 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from loaders import CLEANED_DTYPES
+from parsers import as_integral
+
+# Temizleme sonucu sayısal sütunlar paylaşılan bellekte toplanır; metin sütunları süreçten geri döner
+SHARED_COLUMNS = {col: dtype for col, dtype in CLEANED_DTYPES.items() if dtype in ("float64", "int64", "bool")}
+TEXT_COLUMNS = ["product_name", "brand", "main_category", "sub_category", "about_product", "first_image_url"]
+
+
+class SharedColumns:
+    """Sabit tipli sütunları tek bir paylaşılan bellek bloğunda tutar; süreçler adıyla bağlanır."""
+
+    def __init__(self, n_rows, columns=SHARED_COLUMNS, name=None):
+        self.n_rows = n_rows
+        self.layout = {}
+        offset = 0
+        for col, dtype in columns.items():
+            self.layout[col] = (np.dtype(dtype).str, offset)
+            offset += -(-n_rows * np.dtype(dtype).itemsize // 8) * 8  # 8 byte hizalı
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+
+    def spec(self):
+        """Başka bir süreçte bağlanmak için gereken bilgiler."""
+        return self.shm.name, self.n_rows, {col: dtype for col, (dtype, _) in self.layout.items()}
+
+    def array(self, col):
+        dtype, offset = self.layout[col]
+        return np.ndarray(self.n_rows, dtype=dtype, buffer=self.shm.buf, offset=offset)
+
+    def close(self):
+        self.shm.close()
+
+
+def clean_shard(spec, start, shard):
+    """Alt süreçte bir satır aralığını temizler; sayısal sonuçları paylaşılan belleğe yazar.
+
+    Metin sütunları ve adım süreleri geri döner.
+    """
+    from data_cleaning import clean_products
+    from instrument import StepTimer
+
+    name, n_rows, columns = spec
+    shared = SharedColumns(n_rows, columns, name=name)
+    timer = StepTimer()
+    try:
+        shard = clean_products(shard, verbose=False, timer=timer)
+        stop = start + len(shard)
+        for col in columns:
+            shared.array(col)[start:stop] = shard[col].to_numpy(dtype=columns[col])
+    finally:
+        shared.close()
+    return start, {col: shard[col] for col in TEXT_COLUMNS}, list(shard.columns), timer.steps
+
+
+def clean_parallel(df, workers=None, timer=None):
+    """clean_products'ı satır aralıklarına bölüp süreç havuzunda çalıştırır; sonuç seri çalıştırmayla aynıdır.
+
+    df boş olmamalıdır. quantity'nin int64'e çevrilmesine tüm sütuna bakılarak karar verildiği için
+    birleştirmeden sonra yapılır.
+    """
+    workers = workers or os.cpu_count() or 1
+    bounds = np.linspace(0, len(df), workers + 1).astype(int)
+    shared = SharedColumns(len(df))
+    text_parts = {}
+    columns = None
+    try:
+        # fork, pyarrow iş parçacıklarının tuttuğu kilitleri kopyalayıp kilitlenebilir; süreçler spawn ile başlar
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            futures = [
+                pool.submit(clean_shard, shared.spec(), start, df.iloc[start:stop])
+                for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start
+            ]
+            for future in futures:
+                start, text, columns, steps = future.result()
+                text_parts[start] = text
+                if timer is not None:
+                    timer.merge(steps)
+
+        for col in SHARED_COLUMNS:
+            df[col] = shared.array(col).copy()
+        for col in TEXT_COLUMNS:
+            df[col] = pd.concat([text_parts[start][col] for start in sorted(text_parts)])
+        df["quantity"] = as_integral(df["quantity"])
+        # Sütun sırası seri çalıştırmadakiyle aynı olsun (özet tabloları sıraya bağlı)
+        return df[columns]
+    finally:
+        shared.close()
+        shared.shm.unlink()
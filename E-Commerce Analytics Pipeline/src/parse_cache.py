@@ -0,0 +1,126 @@
+import hashlib
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+PARSE_CACHE_PATH = "data/.parse_cache.sqlite"
+# Bu sayıyı aşan kayıtlar en uzun süredir kullanılmayandan başlayarak silinir
+MAX_ENTRIES = 1_000_000
+
+PARSERS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "parsers.py")
+
+
+def _parsers_version():
+    """parsers.py içeriğinin hash'i; ayrıştırıcı kodu değişince diskteki sonuçlar geçersiz olur."""
+    with open(PARSERS_FILE, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+
+
+class ParseCache:
+    """Ayrıştırma sonuçlarını ham hücre metnine göre SQLite'ta saklar; çalıştırmalar arasında kalıcıdır.
+
+    Her kayıt son kullanıldığı çalıştırmanın numarasını tutar; kayıt sayısı max_entries'i aşınca
+    en eski çalıştırmalardan kalan kayıtlar silinir.
+    """
+
+    def __init__(self, path=PARSE_CACHE_PATH, max_entries=MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = self.misses = 0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS parsed (
+                parser TEXT, raw TEXT, value BLOB, used INTEGER,
+                PRIMARY KEY (parser, raw)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS parsed_used ON parsed (used);
+            CREATE TEMP TABLE keys (raw TEXT PRIMARY KEY);
+        """)
+        meta = dict(self.db.execute("SELECT key, value FROM meta"))
+        version = _parsers_version()
+        if meta.get("version") != version:
+            self.db.execute("DELETE FROM parsed")
+        self.run = int(meta.get("run", 0)) + 1
+        self.db.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                            [("version", version), ("run", str(self.run))])
+        self.db.commit()
+
+    def lookup(self, parser, keys, width):
+        """keys için saklı sonuçları döndürür: (bulundu maskesi, (len(keys), width) float dizisi)."""
+        values = np.full((len(keys), width), np.nan)
+        found = np.zeros(len(keys), dtype=bool)
+        self.db.execute("DELETE FROM keys")
+        self.db.executemany("INSERT INTO keys VALUES (?)", ((k,) for k in keys))
+        rows = self.db.execute(
+            "SELECT p.raw, p.value FROM parsed p JOIN keys k ON p.raw = k.raw WHERE p.parser = ?", (parser,)
+        ).fetchall()
+        if rows:
+            position = pd.Index(keys).get_indexer([raw for raw, _ in rows])
+            values[position] = np.frombuffer(b"".join(v for _, v in rows), dtype=np.float64).reshape(-1, width)
+            found[position] = True
+            self.db.execute(
+                "UPDATE parsed SET used = ? WHERE parser = ? AND raw IN (SELECT raw FROM keys)", (self.run, parser)
+            )
+        self.hits += len(rows)
+        self.misses += len(keys) - len(rows)
+        return found, values
+
+    def store(self, parser, keys, values):
+        self.db.executemany(
+            "INSERT OR REPLACE INTO parsed VALUES (?, ?, ?, ?)",
+            ((parser, k, v.tobytes(), self.run) for k, v in zip(keys, values)),
+        )
+        self.db.commit()
+
+    def evict(self):
+        """Kayıt sayısını max_entries'e indirir; silinen kayıt sayısını döner."""
+        excess = self.db.execute("SELECT COUNT(*) FROM parsed").fetchone()[0] - self.max_entries
+        if excess <= 0:
+            return 0
+        self.db.execute(
+            "DELETE FROM parsed WHERE (parser, raw) IN "
+            "(SELECT parser, raw FROM parsed ORDER BY used LIMIT ?)", (excess,)
+        )
+        self.db.commit()
+        return excess
+
+    def close(self):
+        self.evict()
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def parse_unique(series, parser, cache=None):
+    """parser'ı sadece farklı değerlere uygular ve sonucu satırlara geri dağıtır.
+
+    Değerler önce factorize ile koda çevrilir; cache verilirse diskte sonucu bulunan metinler
+    yeniden ayrıştırılmaz. NaN hücreler NaN döner; sonuç float64'tür.
+    """
+    codes, uniques = pd.factorize(series)
+    uniques = pd.Series(uniques, name=series.name)
+    # Diskteki anahtar ham metindir; metin olmayan değerler sadece bellekte tekilleştirilir
+    if cache is None or not pd.api.types.is_string_dtype(uniques):
+        parsed = parser(uniques)
+        values = parsed.to_numpy(dtype=np.float64).reshape(len(uniques), -1)
+    else:
+        keys = uniques.tolist()
+        empty = parser(uniques[:0])
+        width = empty.shape[1] if empty.ndim == 2 else 1
+        found, values = cache.lookup(parser.__name__, keys, width)
+        parsed = parser(uniques[~found].reset_index(drop=True))
+        values[~found] = parsed.to_numpy(dtype=np.float64).reshape(-1, width)
+        cache.store(parser.__name__, [k for k, hit in zip(keys, found) if not hit], values[~found])
+
+    # codes == -1 (NaN) son satıra, yani NaN sonucuna düşer
+    values = np.vstack([values, np.full((1, values.shape[1]), np.nan)])[codes]
+    if isinstance(parsed, pd.DataFrame):
+        return pd.DataFrame(values, index=series.index, columns=parsed.columns)
+    return pd.Series(values[:, 0], index=series.index, name=series.name)
@@ -0,0 +1,594 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pyarrow yoksa pandas'ın str erişimcisi kullanılır
+    pa = None
+
+# float() ile birebir aynı sonucu veren sade ondalık sayı kalıbı
+NUMBER = r"\d+\.?\d*|\.\d+"
+DIGITS = r"(?:\d[\d$,]*\.?[\d$,]*|\.[$,]*\d[\d$,]*)"
+# Yazdırılabilir ASCII: bu aralıkta Python re ve RE2 (pyarrow) aynı eşleşmeyi verir
+SAFE_TEXT = r"[ -~]*"
+
+SIMPLE_PRICE = r"\$?(?:" + NUMBER + ")"
+SIMPLE_RANGE = r"\$(?:" + NUMBER + r") - \$(?:" + NUMBER + ")"
+PLAIN_PRICE = r"[ $,]*" + DIGITS + r"[ $,]*"
+PRICE_RANGE = r"\$\s*(?P<low>[\d,.]+)\s*-\s*\$\s*(?P<high>[\d,.]+)"
+QUANTITY = r"(?P<value>\d+\.?\d*)"
+SIMPLE_QUANTITY = r"\d+\.?\d*"
+# Tek birimli sık ağırlıklar ("1.2 pounds", "8 ounces (View shipping rates and policies)"); tek boşlukla
+# ayrılan ilk iki parça sayı ve birimdir
+SIMPLE_WEIGHT = r"\d+\.?\d* (?:pounds?|lbs?|ounces?|oz)(?: \([^()\n]*\))?"
+WEIGHT_LBS = r"(?P<amount>\d[\d,.]*)\s*(?P<unit>pounds?|lbs?)"
+WEIGHT_OZ = r"(?P<amount>\d[\d,.]*)\s*(?P<unit>ounces?|oz)"
+
+# Boyut birimlerinin inch böleni; birim yazılmamışsa inch kabul edilir
+INCH_DIVISORS = {
+    "inches": 1.0, "inch": 1.0, "in": 1.0, '"': 1.0,
+    "centimeters": 2.54, "centimeter": 2.54, "cm": 2.54,
+    "millimeters": 25.4, "millimeter": 25.4, "mm": 25.4,
+}
+DIM_UNIT = r"\s*(?P<unit>" + "|".join(INCH_DIVISORS) + ")?"
+DIMS_3 = r"(?i)(?P<length>[\d.]+)\s*x\s*(?P<width>[\d.]+)\s*x\s*(?P<height>[\d.]+)" + DIM_UNIT
+DIMS_2 = r"(?i)(?P<length>[\d.]+)\s*x\s*(?P<width>[\d.]+)" + DIM_UNIT
+SIMPLE_DIMS = r" x ".join([f"(?:{NUMBER})"] * 3) + r"(?: (?:inches|cm|mm))?"
+
+# Etkileşim loglarındaki gün-önce zaman damgası formatları ve format kodlarının satır kalıpları.
+# ISO (yyyy-mm-dd) bilerek yok: format="mixed", dayfirst=True onları yıl-gün-ay okur.
+TIMESTAMP_FORMATS = ["%d/%m/%Y %H:%M", "%d/%m/%Y %H:%M:%S", "%d/%m/%Y"]
+TIMESTAMP_CODES = {
+    "%d": r"(?:0?[1-9]|[12]\d|3[01])",
+    "%m": r"(?:0?[1-9]|1[0-2])",
+    "%Y": r"\d{4}",
+    "%H": r"(?:[01]?\d|2[0-3])",
+    "%M": r"[0-5]\d",
+    "%S": r"[0-5]\d",
+}
+
+# Görsel alanı "|" ile ayrılmış URL listesidir; bu işareti taşıyan URL'ler yer tutucu (boş) görseldir
+IMAGE_SEPARATOR = "|"
+PLACEHOLDER_MARKER = "transparent-pixel"
+IMAGE_DOMAIN = r"https?://(?P<domain>[^/?#\s]+)"
+
+DIM_COLUMNS = ["dim_length", "dim_width", "dim_height"]
+# Kargo firmalarının standart hacimsel ağırlık böleni (inch³ / lb)
+DIM_DIVISOR = 139
+
+
+# ---------------------------------------------------------------------------
+# Tek hücrelik referans ayrıştırıcılar
+# Vektörel yolun garanti veremediği nadir hücreler (ASCII dışı karakter,
+# bilimsel gösterim vb.) bunlarla çözülür; sonuç her zaman birebir aynıdır.
+# ---------------------------------------------------------------------------
+
+def parse_price_value(val):
+    """Fiyat hücresini temizler: $, virgül kaldırır, aralık varsa min değeri alır."""
+    if pd.isna(val):
+        return np.nan
+    val = str(val).strip()
+    if val == "" or val.lower() in ["nan", "none"]:
+        return np.nan
+    range_match = re.search(PRICE_RANGE, val)
+    if range_match:
+        val = range_match.group(1)
+    else:
+        val = val.replace("$", "")
+    val = val.replace(",", "").strip()
+    if val == "" or val == ".":
+        return np.nan
+    try:
+        return float(val)
+    except ValueError:
+        return np.nan
+
+
+def parse_quantity_value(val):
+    if pd.isna(val):
+        return np.nan
+    val = str(val).strip().replace(",", "")
+    if val == "" or val == "." or val.lower() in ["nan", "none"]:
+        return np.nan
+    match = re.search(QUANTITY, val)
+    if match:
+        num = float(match.group(1))
+        return int(num) if num == int(num) else num
+    return np.nan
+
+
+def parse_weight_value(val):
+    """Shipping weight'i ounce cinsinden sayıya çevirir."""
+    if pd.isna(val):
+        return np.nan
+    val = str(val).strip().lower()
+    if val in ["", "nan", "none", "."]:
+        return np.nan
+    val = re.sub(r"\(.*?\)", "", val).strip()
+
+    weight_oz = 0.0
+    match_lbs = re.search(WEIGHT_LBS, val)
+    if match_lbs:
+        num_str = match_lbs.group(1).replace(",", "")
+        # Sadece nokta olan veya boş olan değerleri atla
+        if num_str not in ("", "."):
+            try:
+                weight_oz += float(num_str) * 16
+            except ValueError:
+                pass
+    match_oz = re.search(WEIGHT_OZ, val)
+    if match_oz:
+        num_str = match_oz.group(1).replace(",", "")
+        if num_str not in ("", "."):
+            try:
+                weight_oz += float(num_str)
+            except ValueError:
+                pass
+
+    if weight_oz == 0.0:
+        clean_val = re.sub(r"[^0-9.]", "", val)
+        if clean_val and clean_val != ".":
+            try:
+                weight_oz = float(clean_val) * 16
+            except ValueError:
+                return np.nan
+
+    return weight_oz if weight_oz > 0 else np.nan
+
+
+def _inch_divisor(unit):
+    return INCH_DIVISORS.get((unit or "").lower(), 1.0)
+
+
+def parse_dimensions_value(val):
+    """Boyut stringinden inches cinsinden (L, W, H) çıkarır; cm/mm inch'e çevrilir."""
+    if pd.isna(val):
+        return np.nan, np.nan, np.nan
+    val = str(val).strip()
+    match = re.search(DIMS_3, val)
+    if match:
+        div = _inch_divisor(match.group("unit"))
+        try:
+            return (float(match.group(1)) / div, float(match.group(2)) / div,
+                    float(match.group(3)) / div)
+        except ValueError:
+            return np.nan, np.nan, np.nan
+    match2 = re.search(DIMS_2, val)
+    if match2:
+        div = _inch_divisor(match2.group("unit"))
+        try:
+            return float(match2.group(1)) / div, float(match2.group(2)) / div, np.nan
+        except ValueError:
+            return np.nan, np.nan, np.nan
+    return np.nan, np.nan, np.nan
+
+
+# ---------------------------------------------------------------------------
+# Vektörel ayrıştırıcılar
+# Metin pyarrow varsa arrow string dizisi (RE2 ile işlenir), yoksa sıfırdan
+# indekslenmiş str Series'tir; satırlar etiketle değil pozisyonla seçilir.
+# ---------------------------------------------------------------------------
+
+def _as_text(series):
+    """NaN olmayan hücreleri string'e çevirir; (pozisyonlar, metin) döndürür."""
+    na = series.isna().to_numpy()
+    pos = np.flatnonzero(~na)
+    if pa is not None and getattr(series.dtype, "storage", None) == "pyarrow":
+        # Arrow tabanlı str sütunu pandas'a dönmeden alınır
+        return pos, pc.drop_null(pa.array(series.array)).cast(pa.string())
+    text = series[~na]
+    if not isinstance(text.dtype, pd.StringDtype):
+        text = text.astype(str)
+    if pa is None:
+        return pos, text.reset_index(drop=True)
+    return pos, pa.array(text, type=pa.string())
+
+
+def _mask(result):
+    # Kopya alınır: bazı string backend'leri salt-okunur dizi döndürür
+    if pa is not None and isinstance(result, (pa.Array, pa.ChunkedArray)):
+        return result.to_numpy(zero_copy_only=False).astype(bool)
+    return result.to_numpy(dtype=bool, copy=True)
+
+
+def _take(text, keep):
+    """Maske ya da pozisyon dizisiyle seçilen satırlar (yeni pozisyonlar 0'dan başlar)."""
+    keep = np.asarray(keep)
+    if keep.dtype == bool and keep.all():
+        return text
+    if pa is None:
+        return (text[keep] if keep.dtype == bool else text.iloc[keep]).reset_index(drop=True)
+    return text.filter(pa.array(keep)) if keep.dtype == bool else text.take(pa.array(keep, type=pa.int64()))
+
+
+def _values(text):
+    if pa is None:
+        return text.to_numpy(dtype=object)
+    return text.to_numpy(zero_copy_only=False)
+
+
+def _is_safe(text):
+    """Yazdırılabilir ASCII satırlar: bu aralıkta Python re/str ve RE2/arrow aynı sonucu verir."""
+    if pa is None:
+        return _mask(text.str.fullmatch(SAFE_TEXT))
+    # Regex yerine baytlara bakılır: aralık dışı her bayt kendi satırını güvensiz yapar
+    offsets = np.frombuffer(text.buffers()[1], dtype=np.int32)[text.offset:text.offset + len(text) + 1]
+    safe = np.ones(len(text), dtype=bool)
+    if text.buffers()[2] is not None and offsets[-1] > offsets[0]:
+        data = np.frombuffer(text.buffers()[2], dtype=np.uint8)[offsets[0]:offsets[-1]]
+        bad = np.flatnonzero((data < 0x20) | (data > 0x7E)) + offsets[0]
+        safe[np.searchsorted(offsets, bad, side="right") - 1] = False
+    return safe
+
+
+def _fullmatch(text, pattern):
+    if pa is None:
+        return _mask(text.str.fullmatch(pattern))
+    # RE2'de $ (multiline olmadan) sadece metin sonunda eşleşir; Python fullmatch ile aynıdır
+    return _mask(pc.match_substring_regex(text, f"^(?:{pattern})$"))
+
+
+def _is_number(text):
+    return _fullmatch(text, NUMBER)
+
+
+def _startswith(text, prefix):
+    if pa is None:
+        return _mask(text.str.startswith(prefix))
+    return _mask(pc.starts_with(text, prefix))
+
+
+def _endswith(text, suffix):
+    if pa is None:
+        return _mask(text.str.endswith(suffix))
+    return _mask(pc.ends_with(text, suffix))
+
+
+def _replace(text, pattern, repl="", regex=True):
+    if pa is None:
+        return text.str.replace(pattern, repl, regex=regex)
+    if not regex:
+        return pc.replace_substring(text, pattern, repl)
+    return pc.replace_substring_regex(text, pattern, repl)
+
+
+# Aşağıdaki yardımcılar sadece güvenli (yazdırılabilir ASCII) metinde kullanılır; Python ile sonuç aynıdır
+
+def _strip(text):
+    return text.str.strip() if pa is None else pc.utf8_trim_whitespace(text)
+
+
+def _lower(text):
+    return text.str.lower() if pa is None else pc.ascii_lower(text)
+
+
+def _lstrip(text, chars):
+    return text.str.lstrip(chars) if pa is None else pc.utf8_ltrim(text, characters=chars)
+
+
+def _tokens(text, indices, max_splits=None):
+    """Tek boşlukla bölünen metnin verilen sıradaki parçaları (her satırda bu parçaların olduğu bilinmelidir)."""
+    if pa is None:
+        parts = text.str.split(" ", n=-1 if max_splits is None else max_splits, regex=False)
+        return [parts.str[i] for i in indices]
+    parts = pc.split_pattern(text, " ", max_splits=max_splits)
+    return [pc.list_element(parts, i) for i in indices]
+
+
+def _to_float(text):
+    """Doğrulanmış sayı stringlerini float()'la aynı sonuçla float64'e çevirir."""
+    if pa is not None:
+        return pc.cast(text, pa.float64()).to_numpy(zero_copy_only=False)
+    return np.asarray(text, dtype=object).astype(np.float64)
+
+
+def _extract(text, pattern):
+    """re.search gruplarını tek geçişte çıkarır; (eşleşen satır pozisyonları, grup adı -> metin) döner."""
+    if pa is None or len(text) == 0:
+        groups = pd.Series(_values(text), dtype=object).str.extract(pattern, expand=True)
+        rows = np.flatnonzero(groups.notna().any(axis=1).to_numpy())
+        groups = groups.iloc[rows].reset_index(drop=True)
+        if pa is not None:
+            return rows, {name: pa.array(groups[name], type=pa.string()) for name in groups}
+        return rows, {name: groups[name].fillna("") for name in groups}
+    groups = pc.extract_regex(text, pattern=pattern)
+    valid = _mask(groups.is_valid())
+    fields = groups.filter(pa.array(valid)).flatten()
+    names = [groups.type.field(i).name for i in range(groups.type.num_fields)]
+    return np.flatnonzero(valid), dict(zip(names, fields))
+
+
+def _fallback(out, series, pos, func):
+    """Hızlı yolun kapsamadığı satırları referans fonksiyonla çözer."""
+    if len(pos):
+        values = series.iloc[pos].to_numpy(dtype=object)
+        out[pos] = [func(v) for v in values]
+
+
+def parse_price(series):
+    """parse_price_value ile birebir aynı sonucu veren vektörel fiyat ayrıştırıcı."""
+    out = np.full(len(series), np.nan)
+    pos, text = _as_text(series)
+
+    # En sık biçim ("$12.99"): baştaki $ atılınca sade sayı kalır
+    done = _fullmatch(text, SIMPLE_PRICE)
+    out[pos[done]] = _to_float(_lstrip(_take(text, done), "$"))
+
+    # Sade aralıklar ("$12.99 - $15.00"): alt sınır ilk parçadır
+    rest = np.flatnonzero(~done)
+    ranges = rest[_fullmatch(_take(text, rest), SIMPLE_RANGE)]
+    low, = _tokens(_take(text, ranges), [0], max_splits=1)
+    out[pos[ranges]] = _to_float(_lstrip(low, "$"))
+    done[ranges] = True
+
+    # Binlik ayraçlı/boşluklu tekil fiyatlar ("$1,234.50"): $, virgül ve boşluk silinir
+    rest = np.flatnonzero(~done)
+    plain = rest[_fullmatch(_take(text, rest), PLAIN_PRICE)]
+    out[pos[plain]] = _to_float(_replace(_take(text, plain), r"[$, ]"))
+    done[plain] = True
+
+    # Diğer aralık yazımları: alt sınır regex ile alınır
+    rest = np.flatnonzero(~done & _is_safe(text))
+    rows, groups = _extract(_strip(_take(text, rest)), PRICE_RANGE)
+    low = _replace(groups["low"], ",")
+    ok = _is_number(low)
+    out[pos[rest[rows[ok]]]] = _to_float(_take(low, ok))
+    done[rest[rows[ok]]] = True
+
+    _fallback(out, series, pos[~done], parse_price_value)
+    return pd.Series(out, index=series.index, name=series.name)
+
+
+def parse_quantity(series):
+    """parse_quantity_value ile aynı sonucu verir; tüm değerler tamsayıysa int64 döner."""
+    out = np.full(len(series), np.nan)
+    pos, text = _as_text(series)
+
+    # Sade sayı hücreleri ("12", "3.5") olduğu gibi çevrilir; diğer güvenli hücrelerde boşluk ve
+    # virgül silinir, geriye sade sayı kalmazsa ilk sayı alınır
+    simple = _fullmatch(text, SIMPLE_QUANTITY)
+    rest = np.flatnonzero(~simple & _is_safe(text))
+    cleaned = _replace(_strip(_take(text, rest)), ",", regex=False)
+    plain = _fullmatch(cleaned, SIMPLE_QUANTITY)
+    rows, groups = _extract(_take(cleaned, ~plain), QUANTITY)
+    found = np.concatenate([np.flatnonzero(simple), rest[plain], rest[~plain][rows]])
+    values = np.concatenate([_to_float(_take(text, simple)), _to_float(_take(cleaned, plain)),
+                             _to_float(groups["value"])])
+
+    finite = np.isfinite(values)
+    out[pos[found[finite]]] = values[finite]
+    # int() taşması gibi uç durumlar referans davranışını (hata dahil) korur
+    done = np.zeros(len(pos), dtype=bool)
+    done[simple] = True
+    done[rest] = True
+    done[found[~finite]] = False
+    _fallback(out, series, pos[~done], parse_quantity_value)
+
+    return as_integral(pd.Series(out, index=series.index, name=series.name))
+
+
+def as_integral(result):
+    """Eksiksiz ve tüm değerleri tamsayı olan sonucu int64'e çevirir (parse_quantity_value davranışı)."""
+    out = result.to_numpy(dtype=np.float64)
+    if len(out) and not np.isnan(out).any() and (out == np.floor(out)).all() \
+            and np.abs(out).max() < 2 ** 63:
+        return result.astype(np.int64)
+    return result
+
+
+def _unit_amount(text, pattern):
+    """Birimli sayıyı float'a çevirir; eşleşme yoksa ya da sayı geçersizse 0 döner."""
+    amount = np.zeros(len(text))
+    rows, groups = _extract(text, pattern)
+    num = _replace(groups["amount"], ",")
+    ok = _is_number(num)
+    amount[rows[ok]] = _to_float(_take(num, ok))
+    return amount
+
+
+def parse_weight(series):
+    """parse_weight_value ile birebir aynı sonucu veren vektörel ağırlık ayrıştırıcı (oz)."""
+    out = np.full(len(series), np.nan)
+    pos, text = _as_text(series)
+    safe = _is_safe(text)
+    text = _lower(_take(text, safe))
+    pos, unsafe = pos[safe], pos[~safe]
+
+    # Sık biçimlerde sayı ilk parçadır; birim "o" ile başlıyorsa ounce, değilse pound
+    simple = _fullmatch(text, SIMPLE_WEIGHT)
+    number, unit = _tokens(_take(text, simple), [0, 1], max_splits=2)
+    value = _to_float(number) * np.where(_startswith(unit, "o"), 1, 16)
+    out[pos[simple]] = np.where(value > 0, value, np.nan)
+
+    text = _strip(_replace(_strip(_take(text, ~simple)), r"\(.*?\)"))
+    weight = _unit_amount(text, WEIGHT_LBS) * 16 + _unit_amount(text, WEIGHT_OZ)
+
+    # Birim bulunamadıysa sayısal karakterler pound kabul edilir
+    bare = np.flatnonzero(weight == 0.0)
+    digits = _replace(_take(text, bare), r"[^0-9.]")
+    ok = _is_number(digits)
+    weight[bare[ok]] = _to_float(_take(digits, ok)) * 16
+
+    out[pos[~simple]] = np.where(weight > 0, weight, np.nan)
+    _fallback(out, series, unsafe, parse_weight_value)
+    return pd.Series(out, index=series.index, name=series.name)
+
+
+def _fill_dims(out, pos, groups):
+    """Tüm boyutları geçerli sayı olan eşleşmeleri inch'e çevirip out'a yazar."""
+    names = [name for name in ("length", "width", "height") if name in groups]
+    ok = np.ones(len(pos), dtype=bool)
+    for name in names:
+        ok &= _is_number(groups[name])
+    unit = pd.Series(_values(_take(groups["unit"], ok)), dtype=object).str.lower()
+    divisor = unit.map(INCH_DIVISORS).fillna(1.0).to_numpy(dtype=np.float64)
+    for i, name in enumerate(names):
+        out[pos[ok], i] = _to_float(_take(groups[name], ok)) / divisor
+
+
+def parse_dimensions(series):
+    """Boyut stringinden (L, W, H) sütunlarını tek geçişte float64 olarak çıkarır."""
+    out = np.full((len(series), 3), np.nan)
+    pos, text = _as_text(series)
+    safe = _is_safe(text)
+    text = _take(text, safe)
+    pos, unsafe = pos[safe], pos[~safe]
+
+    # Sık biçim ("12.5 x 3 x 4 inches"): tek boşluklu parçalar bölünür, birim sondan okunur
+    simple = _fullmatch(text, SIMPLE_DIMS)
+    dims = _take(text, simple)
+    divisor = np.select([_endswith(dims, " cm"), _endswith(dims, " mm")],
+                        [INCH_DIVISORS["cm"], INCH_DIVISORS["mm"]], 1.0)
+    for i, part in enumerate(_tokens(dims, [0, 2, 4])):
+        out[pos[simple], i] = _to_float(part) / divisor
+
+    pos = pos[~simple]
+    text = _strip(_take(text, ~simple))
+    rows, three = _extract(text, DIMS_3)
+    _fill_dims(out, pos[rows], three)
+    other = np.ones(len(pos), dtype=bool)
+    other[rows] = False
+    rows, two = _extract(_take(text, other), DIMS_2)
+    _fill_dims(out, pos[other][rows], two)
+
+    _fallback(out, series, unsafe, parse_dimensions_value)
+    return pd.DataFrame(out, index=series.index, columns=DIM_COLUMNS)
+
+
+def volumetric_weight(dims):
+    """Inch cinsinden L/W/H sütunlarından ounce cinsinden hacimsel ağırlık hesaplar."""
+    volume = dims.to_numpy(dtype=np.float64).prod(axis=1)
+    return pd.Series(volume / DIM_DIVISOR * 16, index=dims.index)
+
+
+def _split_urls(text):
+    """URL listelerini tek bir düz diziye açar; (parçalar, her parçanın satır numarası) döner.
+
+    pyarrow varsa parçalar arrow dizisi olarak kalır, sonraki adımlar doğrudan arrow compute ile yapılır.
+    """
+    if pa is not None:
+        lists = pc.split_pattern(text, pattern=IMAGE_SEPARATOR)
+        return pc.list_flatten(lists), pc.list_parent_indices(lists).to_numpy()
+    parts = text.str.split(IMAGE_SEPARATOR, regex=False).explode()
+    return parts.reset_index(drop=True), parts.index.to_numpy()
+
+
+def _contains(parts, marker):
+    if pa is not None:
+        return pc.match_substring(parts, marker).to_numpy(zero_copy_only=False)
+    return _mask(parts.str.contains(marker, regex=False))
+
+
+def _stripped(parts, keep):
+    if pa is not None:
+        return pc.utf8_trim_whitespace(pc.filter(parts, pa.array(keep)))
+    return parts[keep].str.strip().reset_index(drop=True)
+
+
+def image_domains(urls):
+    """Domain başına URL sayısı; regex URL'lerin hepsine değil sadece farklı host anahtarlarına uygulanır."""
+    if pa is not None:
+        # http(s):// ile başlayan URL'lerin anahtarı "http://<host>", diğerlerinin kendisidir
+        prefixed = pc.or_(pc.starts_with(urls, "http://"), pc.starts_with(urls, "https://"))
+        hosts = pc.list_element(pc.split_pattern(urls, "/", max_splits=3), 2)
+        keys = pc.if_else(prefixed, pc.binary_join_element_wise("http://", hosts, ""), urls)
+        counts = pc.value_counts(keys).to_pandas()
+        counts = pd.Series(counts.str.get("counts").to_numpy(), index=counts.str.get("values"))
+    else:
+        counts = pd.Series(urls).value_counts(sort=False)
+    keys = pd.Series(counts.index, dtype=object)
+    rows, groups = _extract(pa.array(keys, type=pa.string()) if pa else keys, IMAGE_DOMAIN)
+    domain = pd.Series(_values(groups["domain"]), dtype=object).str.lower()
+    domains = pd.Series(counts.to_numpy()[rows], index=pd.Index(domain.to_numpy(), name="domain"))
+    return domains.groupby(level=0).sum().sort_values(ascending=False, kind="stable").rename("images")
+
+
+def analyze_images(series, domains=False):
+    """Görsel URL listelerini satır/URL başına Python döngüsü olmadan analiz eder.
+
+    Sayılan görsel "http" içeren ve yer tutucu olmayan parçadır (eski count_images kuralı).
+    (image_count, first_image_url, has_placeholder_image sütunları, domain başına görsel sayısı) döner;
+    domain sayımı sadece domains=True ise yapılır, aksi halde None'dır.
+    """
+    n = len(series)
+    pos, text = _as_text(series)
+    parts, rows = _split_urls(text)
+    rows = pos[rows]
+    placeholder = _contains(parts, PLACEHOLDER_MARKER)
+    valid = _contains(parts, "http") & ~placeholder
+    urls = _stripped(parts, valid)
+    valid_rows = rows[valid]
+
+    has_placeholder = np.zeros(n, dtype=bool)
+    has_placeholder[rows[placeholder]] = True
+    # Parçalar satır sırasıyla geldiği için satırın ilk geçerli URL'si satır numarasının değiştiği yerdir
+    starts = np.flatnonzero(np.diff(valid_rows, prepend=-1) != 0)
+    first = np.full(n, -1)
+    first[valid_rows[starts]] = starts
+    if pa is not None:
+        first_url = pd.array(urls.take(pa.array(first, mask=first < 0)), dtype=pd.StringDtype("pyarrow"))
+    else:
+        first_url = pd.array(np.append(urls.to_numpy(), None)[first], dtype="string")
+
+    images = pd.DataFrame({
+        "image_count": np.bincount(valid_rows, minlength=n).astype(np.int64),
+        "first_image_url": first_url,
+        "has_placeholder_image": has_placeholder,
+    }, index=series.index)
+    return images, image_domains(urls) if domains else None
+
+
+def _timestamp_shape(fmt, day=None):
+    """Format için tam eşleşme kalıbı; day verilirse gün alanı o kalıpla sınırlanır."""
+    codes = dict(TIMESTAMP_CODES, **({"%d": day} if day else {}))
+    return re.sub(r"%[a-zA-Z]", lambda m: codes[m.group()], re.escape(fmt))
+
+
+def detect_timestamp_format(series, formats=TIMESTAMP_FORMATS, sample_size=1000):
+    """Sütuna yayılmış bir örneklemde en çok satırın uyduğu formatı döndürür; hiçbiri uymuyorsa None."""
+    values = series.dropna()
+    if values.empty:
+        return None
+    sample = values.iloc[np.linspace(0, len(values) - 1, min(sample_size, len(values))).astype(int)]
+    sample = sample.astype(str)
+    hits = [sample.str.fullmatch(_timestamp_shape(fmt)).sum() for fmt in formats]
+    return formats[int(np.argmax(hits))] if max(hits) else None
+
+
+def _strptime(text, fmt):
+    """Kalıba uyan metinleri tek çağrıda ayrıştırır; geçersiz tarihler NaT döner."""
+    if pa is None:
+        return pd.to_datetime(text, format=fmt, errors="coerce").to_numpy(dtype="datetime64[us]")
+    parsed = pc.strptime(text, format=fmt, unit="s", error_is_null=True)
+    # Arrow 31/04 gibi taşan günleri sonraki aya kaydırır (01/05); bu satırlar geçersiz sayılır
+    suspect = np.flatnonzero(pc.fill_null(pc.less_equal(pc.day(parsed), 3), False).to_numpy(zero_copy_only=False))
+    late = pc.match_substring_regex(text.take(suspect), "^" + _timestamp_shape(fmt, day=r"(?:29|3[01])") + "$")
+    out = parsed.to_numpy(zero_copy_only=False).astype("datetime64[us]")
+    out[suspect[late.to_numpy(zero_copy_only=False)]] = np.datetime64("NaT")
+    return out
+
+
+def parse_timestamps(series, fmt=None):
+    """Zaman damgalarını baskın formatla vektörel ayrıştırır; uymayan satırlar format="mixed" ile çözülür.
+
+    (sonuç, yavaş yola düşen satır sayısı) döndürür.
+    """
+    fmt = fmt or detect_timestamp_format(series)
+    pos, text = _as_text(series)
+    out = np.full(len(series), np.datetime64("NaT"), dtype="datetime64[us]")
+    done = np.zeros(len(pos), dtype=bool)
+
+    if fmt is not None and len(pos):
+        shaped = _fullmatch(text, _timestamp_shape(fmt))
+        parsed = _strptime(_take(text, shaped), fmt)
+        done[shaped] = ~np.isnat(parsed)
+        out[pos[shaped]] = parsed
+
+    slow = pos[~done]
+    if len(slow):
+        values = series.iloc[slow].astype(str)
+        out[slow] = pd.to_datetime(values, format="mixed", dayfirst=True).to_numpy(dtype="datetime64[us]")
+    return pd.Series(out, index=series.index, name=series.name), len(slow)
@@ -0,0 +1,242 @@
+import ast
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import runpy
+import sys
+import threading
+import traceback
+import warnings
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import redirect_stderr, redirect_stdout
+
+CACHE_PATH = "data/.pipeline_cache.json"
+
+
+def local_imports(script):
+    """Scriptin doğrudan ve dolaylı olarak içe aktardığı, aynı klasördeki .py dosyaları (script dahil)."""
+    folder = os.path.dirname(script)
+    found, todo = set(), [script]
+    while todo:
+        path = todo.pop()
+        if path in found:
+            continue
+        found.add(path)
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), path)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                module = os.path.join(folder, name.split(".")[0] + ".py")
+                if os.path.exists(module):
+                    todo.append(module)
+    return sorted(found)
+
+
+class Stage:
+    """Pipeline adımı: çalıştırılacak script ve argümanları, okuduğu/yazdığı dosyalar.
+
+    Sonucu etkileyen kod dosyaları scriptin yerel import'larından çıkarılır; code ile ek dosya verilebilir.
+    """
+
+    def __init__(self, name, script, inputs, outputs, args=(), code=()):
+        self.name = name
+        self.script = script
+        self.args = list(args)
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.code = sorted(set(local_imports(script) + list(code)))
+
+    def depends_on(self, other):
+        return any(path in other.outputs for path in self.inputs)
+
+
+class Cache:
+    """Dosya içerik hash'lerini ve adımların son başarılı çalıştığı anahtarları JSON dosyasında tutar.
+
+    Dosya hash'i (boyut, mtime) değişmedikçe yeniden hesaplanmaz; değişmemiş bir tekrar çalıştırmada
+    büyük girdi dosyaları okunmaz.
+    """
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        self.files = data.get("files", {})
+        self.stages = data.get("stages", {})
+
+    def file_digest(self, path):
+        if not os.path.exists(path):
+            return None
+        st = os.stat(path)
+        stamp = f"{st.st_size}:{st.st_mtime_ns}"
+        with self.lock:
+            entry = self.files.get(path)
+        if entry and entry[0] == stamp:
+            return entry[1]
+        h = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        with self.lock:
+            self.files[path] = [stamp, h.hexdigest()]
+        return h.hexdigest()
+
+    def stage_key(self, stage):
+        """Girdi ve kod dosyalarının içeriğinden ve scripte verilen argümanlardan adımın anahtarını üretir."""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(json.dumps(stage.args).encode())
+        for path in sorted(set(stage.inputs + stage.code)):
+            h.update(f"{path}={self.file_digest(path)}\n".encode())
+        return h.hexdigest()
+
+    def is_fresh(self, stage, key):
+        with self.lock:
+            stored = self.stages.get(stage.name)
+        return stored == key and all(os.path.exists(path) for path in stage.outputs)
+
+    def record(self, stage, key):
+        with self.lock:
+            self.stages[stage.name] = key
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"files": self.files, "stages": self.stages}, f, indent=1)
+            os.replace(tmp, self.path)
+
+
+class StageOutput(io.TextIOBase):
+    """Adımın çıktısını biriktirmeden, tamamlanan her satırda önekiyle birlikte hemen basar."""
+
+    def __init__(self, stream, prefix=""):
+        self.stream = stream
+        self.prefix = prefix
+        self.partial = ""
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        *lines, self.partial = (self.partial + text).split("\n")
+        if lines:
+            self.stream.write("".join(f"{self.prefix}{line}\n" for line in lines))
+            self.stream.flush()
+        return len(text)
+
+    def flush(self):
+        if self.partial:
+            self.stream.write(self.prefix + self.partial)
+            self.partial = ""
+        self.stream.flush()
+
+
+def execute(script, args=(), prefix=""):
+    """Scripti bu süreçte __main__ olarak çalıştırır ve çıkış kodunu döner.
+
+    sys.argv, çalışma klasörü ve uyarı filtreleri çağrıdan sonra geri yüklenir; stdout/stderr
+    önekli StageOutput'a yönlendirilir.
+    """
+    output = StageOutput(sys.stdout, prefix)
+    argv, cwd = sys.argv, os.getcwd()
+    sys.argv = [script] + list(args)
+    try:
+        with redirect_stdout(output), redirect_stderr(output), warnings.catch_warnings():
+            try:
+                runpy.run_path(script, run_name="__main__")
+            except SystemExit as e:
+                return 0 if e.code is None else e.code
+            except Exception:
+                traceback.print_exc()
+                return 1
+        return 0
+    finally:
+        output.flush()
+        sys.argv = argv
+        os.chdir(cwd)
+
+
+def _init_worker(cwd):
+    # pandas her işçi süreçte bir kez yüklenir; aynı işçide çalışan sonraki adımlar yeniden yüklemez
+    os.chdir(cwd)
+    import pandas  # noqa: F401
+
+
+def _announce(stage, prefix=""):
+    print("=" * 60)
+    print(f"{prefix}▶ {stage.name}  ({' '.join([stage.script] + stage.args)})")
+    print("=" * 60, flush=True)
+
+
+def _finish(stage, key, code, cache):
+    if code != 0:
+        print(f"\n❌ {stage.script} hata ile sonlandı (exit code: {code})")
+        return "failed"
+    cache.record(stage, key)
+    print()
+    return "done"
+
+
+def run_pipeline(stages, force=False, max_workers=None):
+    """Adımları bağımlılık sırasıyla çalıştırır; 'skipped', 'done' veya 'failed' durumlarını döner.
+
+    Tek hazır adım ana süreçte çalışır. Aynı anda hazır olan bağımsız adımlar spawn ile başlatılan
+    işçi süreçlerde eşzamanlı çalışır; çıktıları satır satır, adım adıyla öneklenerek akar.
+    """
+    cache = Cache()
+    deps = {s.name: [o.name for o in stages if o is not s and s.depends_on(o)] for s in stages}
+    status = {}
+    pending = list(stages)
+    running = {}
+    pool = None
+
+    try:
+        while pending or running:
+            if any(v == "failed" for v in status.values()):
+                pending = []
+            ready = [s for s in pending if all(dep in status for dep in deps[s.name])]
+            pending = [s for s in pending if s not in ready]
+            todo = []
+            for stage in ready:
+                key = cache.stage_key(stage)
+                if not force and cache.is_fresh(stage, key):
+                    print(f"⏭  {stage.name}: girdiler ve kod değişmedi, atlandı.")
+                    status[stage.name] = "skipped"
+                else:
+                    todo.append((stage, key))
+
+            if len(todo) == 1 and not running:
+                stage, key = todo[0]
+                _announce(stage)
+                status[stage.name] = _finish(stage, key, execute(stage.script, stage.args), cache)
+                continue
+            if todo and pool is None:
+                pool = ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context("spawn"),
+                                           initializer=_init_worker, initargs=(os.getcwd(),))
+            for stage, key in todo:
+                prefix = f"[{stage.name}] "
+                _announce(stage, prefix)
+                running[pool.submit(execute, stage.script, stage.args, prefix)] = (stage, key)
+            if not running:
+                if ready:
+                    # Atlanan adımlar bekleyen adımların önünü açmış olabilir
+                    continue
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage, key = running.pop(future)
+                status[stage.name] = _finish(stage, key, future.result(), cache)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return status
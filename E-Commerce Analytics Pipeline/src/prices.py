@@ -0,0 +1,38 @@
+import numpy as np
+
+# Eksik fiyat tahmini: satış fiyatı liste fiyatının %85'i, liste fiyatı satış fiyatının %115'i kabul edilir
+SELL_RATIO = 0.85
+LIST_RATIO = 1.15
+
+
+def _fix_numpy(selling, list_price, amount, pct):
+    swap = selling > list_price  # NaN karşılaştırmaları False döner
+    low = list_price[swap]
+    list_price[swap] = selling[swap]
+    selling[swap] = low
+
+    fill_sell = np.isnan(selling) & ~np.isnan(list_price)
+    np.multiply(list_price, SELL_RATIO, out=selling, where=fill_sell)
+    fill_list = np.isnan(list_price) & ~np.isnan(selling)
+    np.multiply(selling, LIST_RATIO, out=list_price, where=fill_list)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.subtract(list_price, selling, out=amount)
+        np.divide(amount, list_price, out=pct)
+    pct *= 100
+    return int(swap.sum()), int(fill_sell.sum()), int(fill_list.sum())
+
+
+def fix_prices(selling, list_price):
+    """Fiyat tutarlılığı, eksik fiyat tahmini ve indirim hesabını iki float64 dizi üzerinde yerinde yapar.
+
+    selling > list olan satırlar yer değiştirir, eksik fiyat diğerinden tahmin edilir; indirim tutarı
+    ve yüzdesi (2 hane, negatifler 0) hesaplanır. (indirim, indirim %, swap, dolan satış, dolan liste) döner.
+    """
+    amount = np.empty_like(selling)
+    pct = np.empty_like(selling)
+    swaps, filled_sell, filled_list = _fix_numpy(selling, list_price, amount, pct)
+    # Negatif kontrolü yuvarlanmış değere uygulanır
+    np.round(pct, 2, out=pct)
+    np.copyto(pct, 0.0, where=pct < 0)
+    return amount, pct, swaps, filled_sell, filled_list
@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+
+
+class ProductTable:
+    """Ürün boyut tablosu: product_id'ler satır numarasına (kod) çevrilir, öznitelikler kodla okunur.
+
+    Etkileşim tarafına sadece int kod eklenir; ürün adı/kategori gibi metinler olgu tablosuna
+    kopyalanmaz, kategorik kodlar üzerinden seçilir.
+    """
+
+    def __init__(self, df):
+        self.df = df.drop_duplicates("product_id").reset_index(drop=True)
+        for col in ("product_name", "category"):
+            if col in self.df and not isinstance(self.df[col].dtype, pd.CategoricalDtype):
+                self.df[col] = self.df[col].astype("category")
+        self.index = pd.Index(self.df["product_id"])
+
+    def codes(self, product_ids):
+        """product_id'leri tablodaki satır numarasına çevirir; katalogda olmayanlar -1 olur.
+
+        Id'ler önce tek hash geçişiyle int'e çevrilir (factorize); katalogda sadece farklı id'ler aranır.
+        """
+        local, uniques = pd.factorize(product_ids)
+        mapping = np.append(self.index.get_indexer(uniques), -1)
+        return pd.Series(mapping[local], index=product_ids.index, name="product_code")
+
+    def take(self, column, codes):
+        """Sütun değerlerini kodlarla seçer; -1 kodları NaN döner (left join)."""
+        values = self.df[column].array.take(codes.to_numpy(), allow_fill=True)
+        return pd.Series(values, index=codes.index, name=column)
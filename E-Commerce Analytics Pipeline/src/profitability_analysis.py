@@ -0,0 +1,133 @@
+import os
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from loaders import read_cleaned
+from products import ProductTable
+from weekly_store import WeeklyStore
+
+warnings.filterwarnings("ignore")
+
+OUTPUT_DIR = "data/processed"
+OUTPUT_FILES = {
+    "brand": "brand_profitability.csv",
+    "category": "category_profitability.csv",
+    "subcategory": "subcategory_profitability.csv",
+    "top": "top50_profitable_products.csv",
+    "bottom": "top50_loss_products.csv",
+}
+OUTPUT_PATHS = [os.path.join(OUTPUT_DIR, name) for name in OUTPUT_FILES.values()]
+
+PROFIT_COLUMNS = ["product_id", "product_name", "brand", "main_category", "sub_category", "selling_price"]
+# Katalogda maliyet yok; tahmini maliyet satış fiyatının sabit oranıdır
+COST_RATIO = 0.7
+TOP_N = 50
+GROUP_KEYS = ["main_category", "sub_category", "brand"]
+
+
+def product_margins(products, units):
+    """Ürün bazında tahmini maliyet, kâr ve marj metriklerini hesaplar; fiyatı olmayan ürünler atlanır."""
+    df = products.df.assign(units_sold=units)
+    df = df[df["selling_price"].notna()]
+    price = df["selling_price"]
+    cost = price * COST_RATIO
+    profit = price - cost
+    return df.assign(
+        estimated_cost=cost,
+        profit=profit,
+        profit_margin_pct=profit / cost * 100,
+        gross_margin_pct=profit / price * 100,
+        sales_profit=df["units_sold"] * profit,
+    )
+
+
+def purchase_units(products, counts):
+    """Katalogdaki her ürünün satın alma sayısı (ürün tablosu satır sırasıyla).
+
+    counts haftalık depodaki (hafta, ürün, etkileşim tipi) sayımlarıdır; ham log yeniden okunmaz.
+    """
+    purchases = counts[counts["interaction_type"] == "purchase"]
+    codes = products.codes(purchases["product_id"]).to_numpy()
+    found = codes >= 0
+    units = np.bincount(codes[found], weights=purchases["count"].to_numpy()[found], minlength=len(products.df))
+    return units.astype(np.int64)
+
+
+def rollup(partial, level):
+    """Tek geçişte üretilen (ana kategori, alt kategori, marka) toplamlarını bir seviyeye indirger."""
+    sums = partial.groupby(level=level, observed=True).sum()
+    sums = sums[sums["product_count"] > 0]
+    return pd.DataFrame({
+        "product_count": sums["product_count"],
+        "avg_selling_price": sums["total_revenue"] / sums["product_count"],
+        "avg_cost": sums["total_cost"] / sums["product_count"],
+        "total_revenue": sums["total_revenue"],
+        "total_profit": sums["total_profit"],
+        "avg_profit": sums["total_profit"] / sums["product_count"],
+        "avg_margin_pct": sums["margin_sum"] / sums["product_count"],
+        "avg_gross_margin": sums["gross_margin_sum"] / sums["product_count"],
+        "units_sold": sums["units_sold"],
+        "sales_profit": sums["sales_profit"],
+    }).sort_values("total_revenue", ascending=False, kind="stable").reset_index()
+
+
+def profitability_tables(margins):
+    """Beş çıktı tablosunu tek gruplama geçişinden ve kısmi seçimle üretir."""
+    partial = margins.groupby(GROUP_KEYS, observed=True, dropna=False).agg(
+        product_count=("selling_price", "size"),
+        total_revenue=("selling_price", "sum"),
+        total_cost=("estimated_cost", "sum"),
+        total_profit=("profit", "sum"),
+        margin_sum=("profit_margin_pct", "sum"),
+        gross_margin_sum=("gross_margin_pct", "sum"),
+        units_sold=("units_sold", "sum"),
+        sales_profit=("sales_profit", "sum"),
+    )
+    tail = ["units_sold", "sales_profit"]
+
+    brands = rollup(partial, "brand")
+    brands = brands[brands["brand"] != "Unknown"]
+    product_cols = ["product_id", "product_name", "brand", "main_category", "selling_price",
+                    "estimated_cost", "profit", "profit_margin_pct", "gross_margin_pct", "units_sold"]
+    return {
+        "brand": brands[["brand", "product_count", "total_revenue", "total_profit", "avg_margin_pct"] + tail],
+        "category": rollup(partial, "main_category")[
+            ["main_category", "product_count", "avg_selling_price", "avg_cost", "total_revenue",
+             "total_profit", "avg_profit", "avg_margin_pct", "avg_gross_margin"] + tail],
+        "subcategory": rollup(partial, "sub_category")[
+            ["sub_category", "product_count", "total_revenue", "total_profit", "avg_profit",
+             "avg_margin_pct"] + tail],
+        # nlargest/nsmallest tüm tabloyu sıralamaz; sadece ilk N satır seçilir
+        "top": margins.nlargest(TOP_N, "profit")[product_cols],
+        "bottom": margins.nsmallest(TOP_N, "profit")[product_cols],
+    }
+
+
+def main():
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    products = ProductTable(read_cleaned(PROFIT_COLUMNS))
+    # Depo sadece okunur; weekly_store.py adımı günceller
+    margins = product_margins(products, purchase_units(products, WeeklyStore().counts()))
+    tables = profitability_tables(margins)
+
+    print("=" * 60)
+    print("KÂRLILIK ANALİZİ")
+    print("=" * 60)
+    print(f"Fiyatı bilinen ürün sayısı  : {len(margins):,}")
+    print(f"Toplam katalog geliri       : ${margins['selling_price'].sum():,.2f}")
+    print(f"Toplam tahmini kâr          : ${margins['profit'].sum():,.2f}")
+    print(f"Satın alınan ürün adedi     : {margins['units_sold'].sum():,}")
+    print(f"Satışlardan tahmini kâr     : ${margins['sales_profit'].sum():,.2f}")
+    print("\nEn kârlı ana kategoriler:")
+    print(tables["category"].head(5)[["main_category", "product_count", "total_revenue", "total_profit"]]
+          .to_string(index=False))
+
+    for key, name in OUTPUT_FILES.items():
+        tables[key].to_csv(os.path.join(OUTPUT_DIR, name), index=False)
+        print(f"💾 {name}: {len(tables[key])} satır")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+def top_k(df, group, value, k=5):
+    """Her grup için value'ya göre en büyük k satırı döndürür; tüm tablo sıralanmaz.
+
+    Gruplar sıralı gelir; grup içinde değer azalan, eşitlikte girdideki sıra korunur.
+    """
+    df = df.reset_index(drop=True)
+    if df.empty:
+        return df
+    best = df.groupby(group, observed=True, sort=True)[value].nlargest(k)
+    return df.loc[best.index.get_level_values(-1)].reset_index(drop=True)
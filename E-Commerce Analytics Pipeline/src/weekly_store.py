@@ -0,0 +1,206 @@
+import glob
+import hashlib
+import json
+import os
+import shutil
+import sys
+
+import pandas as pd
+
+from loaders import SALES_PATH, pq, read_interactions_from
+from parsers import parse_timestamps
+from weeks import week_start
+
+STORE_DIR = "data/processed/weekly_store"
+STATE_FILE = "state.json"
+# Deponun güncellendiğini gösteren dosya; pipeline'da depoyu okuyan adımların girdisidir
+STATE_PATH = os.path.join(STORE_DIR, STATE_FILE)
+# Dosyanın baştan yeniden yazıldığını anlamak için bakılan ilk bayt sayısı
+SIGNATURE_BYTES = 4096
+
+KEYS = ["week_start", "product_id", "interaction_type"]
+
+
+def _signature(path, size):
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(min(size, SIGNATURE_BYTES)), digest_size=16).hexdigest()
+
+
+def aggregate(df):
+    """Ham etkileşimleri (hafta, ürün, etkileşim tipi) başına satır sayısına indirger."""
+    df = df.dropna(subset=["interaction_type"])
+    timestamps, fallback = parse_timestamps(df["timestamp"])
+    counts = (
+        pd.DataFrame({
+            "week_start": week_start(timestamps),
+            "product_id": df["product_id"],
+            "interaction_type": df["interaction_type"].astype(str),
+        })
+        .groupby(KEYS, dropna=False)
+        .size()
+        .reset_index(name="count")
+    )
+    return counts, timestamps, fallback
+
+
+class WeeklyStore:
+    """Haftalık etkileşim sayımlarını hafta başına bir dosyada saklar.
+
+    Etkileşim dosyasının okunan son bayt konumu (high-water mark) state.json'da tutulur; her
+    çalıştırmada sadece yeni eklenen satırlar okunur ve yalnızca etkilenen haftaların dosyaları
+    yeniden yazılır. Dosyanın başı değişmiş ya da dosya kısalmışsa depo sıfırdan kurulur.
+
+    Güncellenen haftalar yeni kuşak numaralı dosyalara yazılır ve state.json hangi haftanın hangi
+    dosyada olduğunu offset ile birlikte tutar. state.json'ın atomik yazımı güncellemenin tek onay
+    noktasıdır: öncesinde kesilen bir çalıştırma eski dosyaları ve eski offset'i görür, sayım ikilenmez.
+    Satır sonu olmadan biten son satırın sayımı da state.json'da tutulur ve her çalıştırmada yenilenir.
+    """
+
+    def __init__(self, directory=STORE_DIR, source=SALES_PATH):
+        self.directory = directory
+        self.source = source
+        self.ext = ".parquet" if pq is not None else ".csv"
+        self.state = self._load_state()
+
+    def _load_state(self):
+        try:
+            with open(os.path.join(self.directory, STATE_FILE), encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        # Hafta dosyası listesi olmayan (eski biçimli) depolar yeniden kurulur
+        valid = state.get("source") == self.source and state.get("ext") == self.ext and "files" in state
+        return state if valid else {}
+
+    def _read(self, path):
+        if self.ext == ".parquet":
+            return pd.read_parquet(path)
+        return pd.read_csv(path, parse_dates=["week_start"], dtype={"product_id": str})
+
+    def _write(self, df, path):
+        tmp = path + ".tmp"
+        if self.ext == ".parquet":
+            df.to_parquet(tmp, index=False)
+        else:
+            df.to_csv(tmp, index=False)
+        os.replace(tmp, path)
+
+    def _prune(self):
+        # Kesilen bir güncellemeden kalan ya da yerine yenisi yazılmış hafta dosyaları silinir
+        live = set(self.state.get("files", {}).values())
+        for path in glob.glob(os.path.join(self.directory, "*" + self.ext)):
+            if os.path.basename(path) not in live:
+                os.remove(path)
+
+    def reset(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.state = {}
+
+    def update(self):
+        """Yeni satırları okuyup depoya ekler; (yeni etkileşim, güncellenen haftalar, yavaş yol satırı) döner."""
+        size = os.path.getsize(self.source)
+        offset = self.state.get("offset", 0)
+        if offset and (size < offset or _signature(self.source, offset) != self.state.get("signature")):
+            print("⚠️  Etkileşim dosyası baştan değişmiş; haftalık depo yeniden kuruluyor.")
+            offset = 0
+        if offset and size == self.state.get("size"):
+            # Dosya değişmemiş; state.json yeniden yazılmaz (pipeline önbelleği için de önemli)
+            return 0, [], 0
+        if offset == 0:
+            # Baştan okunacaksa eski hafta dosyaları sayımları ikiler; depo temizlenir
+            self.reset()
+        os.makedirs(self.directory, exist_ok=True)
+
+        df, new_offset, tail = read_interactions_from(offset, self.source)
+        files = dict(self.state.get("files", {}))
+        generation = self.state.get("generation", 0) + 1
+        weeks, fallback, interactions = [], 0, 0
+        if len(df):
+            counts, timestamps, fallback = aggregate(df)
+            interactions = int(counts["count"].sum())
+            for week, new in counts.groupby("week_start"):
+                name = pd.Timestamp(week).strftime("%Y-%m-%d")
+                if name in files:
+                    new = (
+                        pd.concat([self._read(os.path.join(self.directory, files[name])), new], ignore_index=True)
+                        .groupby(KEYS, dropna=False)["count"]
+                        .sum()
+                        .reset_index()
+                    )
+                files[name] = f"{name}.{generation}{self.ext}"
+                self._write(new, os.path.join(self.directory, files[name]))
+                weeks.append(week)
+            bounds = [t for t in (self.state.get("first"), self.state.get("last")) if t]
+            bounds = pd.to_datetime(bounds + [timestamps.min(), timestamps.max()])
+            self.state["first"], self.state["last"] = str(bounds.min()), str(bounds.max())
+
+        # Son satırın önceki sayımı yerine yenisi geçer; net fark yeni etkileşim olarak raporlanır
+        interactions -= sum(r["count"] for r in self.state.get("tail", []))
+        self.state["tail"] = []
+        if len(tail):
+            tail_counts, tail_timestamps, tail_fallback = aggregate(tail)
+            fallback += tail_fallback
+            interactions += int(tail_counts["count"].sum())
+            weeks += [w for w in tail_counts["week_start"] if w not in weeks]
+            tail_counts["week_start"] = tail_counts["week_start"].astype(str)
+            # JSON'a yazılabilmesi için eksik değerler None olur
+            self.state["tail"] = tail_counts.astype(object).where(tail_counts.notna(), None).to_dict("records")
+            self.state["tail_period"] = [str(tail_timestamps.min()), str(tail_timestamps.max())]
+
+        rows = self.state.get("rows", 0) + len(df)
+        self.state.update({
+            "source": self.source,
+            "ext": self.ext,
+            "offset": new_offset,
+            "size": size,
+            "signature": _signature(self.source, new_offset),
+            "rows": rows,
+            "files": files,
+            "generation": generation,
+        })
+        tmp = os.path.join(self.directory, STATE_FILE + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, indent=1)
+        os.replace(tmp, os.path.join(self.directory, STATE_FILE))
+        self._prune()
+        return interactions, weeks, fallback
+
+    def counts(self):
+        """Tüm haftaların sayımlarını tek tabloda döndürür."""
+        paths = [os.path.join(self.directory, name) for _, name in sorted(self.state.get("files", {}).items())]
+        parts = [self._read(path) for path in paths]
+        if self.state.get("tail"):
+            tail = pd.DataFrame(self.state["tail"])
+            parts.append(tail.assign(week_start=pd.to_datetime(tail["week_start"])))
+        if not parts:
+            return pd.DataFrame({"week_start": pd.Series(dtype="datetime64[us]"),
+                                 "product_id": pd.Series(dtype=str),
+                                 "interaction_type": pd.Series(dtype=str),
+                                 "count": pd.Series(dtype="int64")})
+        counts = pd.concat(parts, ignore_index=True)
+        if self.state.get("tail"):
+            # Son satır tamamlanmış bir haftaya düşebilir; aynı anahtarlar birleştirilir
+            counts = counts.groupby(KEYS, dropna=False, sort=False)["count"].sum().reset_index()
+        return counts
+
+    def period(self):
+        """Depodaki ilk ve son etkileşimin zaman damgası."""
+        bounds = [t for t in (self.state.get("first"), self.state.get("last")) if t]
+        if self.state.get("tail"):
+            bounds += self.state["tail_period"]
+        bounds = pd.to_datetime(bounds)
+        return bounds.min(), bounds.max()
+
+
+def main():
+    # Kullanım: python weekly_store.py [--rebuild]
+    store = WeeklyStore()
+    if "--rebuild" in sys.argv:
+        store.reset()
+    new_rows, updated_weeks, ts_fallback = store.update()
+    print(f"Yeni etkileşim: {new_rows}, güncellenen hafta: {len(updated_weeks)}, "
+          f"format dışı (yavaş yol) zaman damgası: {ts_fallback}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+import numpy as np
+import pandas as pd
+
+# 1970-01-01 bir Perşembe; gün sayısına 3 eklenince haftalar Pazartesi'den başlar
+_MONDAY_OFFSET = 3
+
+
+def week_start(timestamps):
+    """Zaman damgalarını ISO hafta başına (Pazartesi 00:00) yuvarlar; NaT olduğu gibi kalır."""
+    days = timestamps.to_numpy(dtype="datetime64[D]")
+    n = days.astype(np.int64)
+    starts = ((n + _MONDAY_OFFSET) // 7 * 7 - _MONDAY_OFFSET).astype("datetime64[D]")
+    starts[np.isnat(days)] = np.datetime64("NaT")
+    return pd.Series(starts.astype("datetime64[ns]"), index=timestamps.index, name="week_start")
+
+
+def week_key(starts):
+    """Hafta başlarını 'YYYY-Www' etiketli sıralı kategorik anahtara çevirir.
+
+    Etiket sadece farklı haftalar için üretilir; kategoriler kronolojik sıradadır.
+    """
+    codes, uniques = pd.factorize(starts, sort=True)
+    iso = pd.DatetimeIndex(uniques).isocalendar()
+    labels = [f"{year}-W{week:02d}" for year, week in zip(iso["year"], iso["week"])]
+    return pd.Series(pd.Categorical.from_codes(codes, categories=labels, ordered=True),
+                     index=starts.index, name="year_week")
@@ -0,0 +1,85 @@
+"""Vektörel ayrıştırıcıları hücre başına referans fonksiyonlarla 1M satırlık sentetik katalogda karşılaştırır.
+
+Kullanım: python tests/bench_parsers.py [satır sayısı]
+Süreler CPU zamanıdır (process_time); paylaşımlı makinelerde duvar saatinden daha kararlıdır.
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import parsers  # noqa: E402
+
+
+def joined(*parts):
+    out = parts[0]
+    for part in parts[1:]:
+        out = np.char.add(out, part)
+    return out
+
+
+def catalog(n, seed=0):
+    """Gerçek katalogdaki biçimlerde, fiyat ve boyutları çoğunlukla farklı olan sütunlar üretir."""
+    rng = np.random.default_rng(seed)
+    price = rng.uniform(1, 500, n).round(2).astype(str)
+    high = (rng.uniform(1, 500, n) + 100).round(2).astype(str)
+    k = rng.random(n)
+    prices = np.where(k < 0.85, joined("$", price),
+                      np.where(k < 0.94, joined("$", price, " - $", high),
+                               joined("$", rng.integers(1, 9, n).astype(str), ",299.00")))
+    pounds = rng.uniform(0.1, 60, n).round(1).astype(str)
+    ounces = rng.integers(1, 16, n).astype(str)
+    k = rng.random(n)
+    weights = np.where(k < 0.45, joined(pounds, " pounds"),
+                       np.where(k < 0.75, joined(pounds, " pounds (View shipping rates and policies)"),
+                                np.where(k < 0.95, joined(ounces, " ounces (View shipping rates and policies)"),
+                                         joined(ounces, " Ounces"))))
+    d = rng.uniform(0.5, 40, (3, n)).round(1).astype(str)
+    dims = joined(d[0], " x ", d[1], " x ", d[2])
+    k = rng.random(n)
+    dims = np.where(k < 0.85, joined(dims, " inches"), np.where(k < 0.95, joined(dims, " cm"), dims))
+    quantity = rng.integers(1, 5000, n).astype(str)
+    quantity = np.where(rng.random(n) < 0.1, joined(quantity, ",000"), quantity)
+
+    def column(values, missing):
+        s = pd.Series(values, dtype=object)
+        s[rng.random(n) < missing] = None
+        return s.astype("str")
+
+    return {
+        "selling_price": column(prices, 0.2),
+        "quantity": column(quantity, 0.3),
+        "shipping_weight": column(weights, 0.15),
+        "product_dimensions": column(dims, 0.25),
+    }
+
+
+def best(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.process_time()
+        func()
+        times.append(time.process_time() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    columns = catalog(n)
+    cases = [
+        ("price", "selling_price", parsers.parse_price, parsers.parse_price_value),
+        ("quantity", "quantity", parsers.parse_quantity, parsers.parse_quantity_value),
+        ("weight", "shipping_weight", parsers.parse_weight, parsers.parse_weight_value),
+        ("dimensions", "product_dimensions", parsers.parse_dimensions, parsers.parse_dimensions_value),
+    ]
+    print(f"{n:,} satır, pyarrow: {'var' if parsers.pa is not None else 'yok'}")
+    for name, col, vectorized, per_cell in cases:
+        s = columns[col]
+        fast = best(lambda: vectorized(s), 7)
+        slow = best(lambda: s.apply(per_cell), 3)
+        print(f"{name:10s} farklı değer {s.nunique():>8,}  hücre başına {slow:6.2f}s  "
+              f"vektörel {fast:6.3f}s  {slow / fast:5.1f}x")
@@ -0,0 +1,52 @@
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from data_cleaning import run_batch, run_streaming  # noqa: E402
+from loaders import (CLEANED_CSV_PATH, CLEANED_DTYPES, CLEANED_PATH, PRODUCT_COLUMNS, PRODUCT_PATH,  # noqa: E402
+                     CleanedWriter, pq)
+from test_parallel_clean import write_catalog  # noqa: E402
+
+
+def outputs():
+    with open(CLEANED_CSV_PATH, "rb") as f:
+        csv = f.read()
+    return csv, pd.read_parquet(CLEANED_PATH) if pq is not None else None
+
+
+def test_batch_and_streaming_runs_write_the_same_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs(os.path.dirname(PRODUCT_PATH))
+    write_catalog(PRODUCT_PATH)
+    # Tüm miktarlar tamsayı: toplu çalıştırmada quantity int64 olur, parçalarda da aynı yazılmalı
+    raw = pd.read_csv(PRODUCT_PATH, dtype=str)
+    quantity = {std: raw_name for raw_name, std in PRODUCT_COLUMNS.items()}["quantity"]
+    raw[quantity] = ["1", "2,000"] * (len(raw) // 2) + ["3"] * (len(raw) % 2)
+    raw.to_csv(PRODUCT_PATH, index=False)
+
+    run_batch()
+    batch_csv, batch_parquet = outputs()
+    run_streaming(70)
+    csv, parquet = outputs()
+
+    assert csv == batch_csv
+    if pq is not None:
+        pd.testing.assert_frame_equal(parquet, batch_parquet)
+
+
+def test_run_without_chunks_replaces_previous_outputs(tmp_path):
+    csv_path, parquet_path = tmp_path / "cleaned.csv", tmp_path / "cleaned.parquet"
+    csv_path.write_text("eski\n")
+    parquet_path.write_bytes(b"eski")
+    with CleanedWriter(str(csv_path), str(parquet_path)):
+        pass
+
+    assert csv_path.read_text().strip() == ",".join(CLEANED_DTYPES)
+    if pq is not None:
+        table = pq.read_table(parquet_path)
+        assert table.num_rows == 0 and table.column_names == list(CLEANED_DTYPES)
+    else:
+        assert not parquet_path.exists()
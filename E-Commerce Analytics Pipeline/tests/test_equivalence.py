@@ -0,0 +1,59 @@
+import os
+import random
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import parsers  # noqa: E402
+
+# Vektörel ayrıştırıcıların hızlı yolları ile referans fonksiyonların ayrıştığı uç durumları üreten parçalar
+TOKENS = ["$", "1", "23", ".5", ",", "1,234", "  ", "-", " - $", "pounds", "lbs", "oz", "ounces", "(", "approx",
+          ")", " x ", "Pounds", "OZ", "nan", "None", "é", "\n", "0", "0.0", "kg", "1e5", "١", "cm", "mm", "inches"]
+ALPHABET = "0123456789.,$ -xX()lbsoundzcmin\tÄé"
+
+
+def well_formed(rng):
+    # Gerçek katalogdaki sık biçimler; vektörel hızlı yollardan geçer
+    number = f"{rng.uniform(0, 3000):.{rng.randint(0, 2)}f}"
+    return rng.choice([
+        f"${number}", f"${int(float(number)):,}.00", f"${number} - ${rng.uniform(0, 99):.2f}", number,
+        f"{number} pounds", f"{number} Ounces (View shipping rates and policies)", f"{number} lbs",
+        f"{number} x {rng.randint(1, 30)} x 2.5 inches", f"{number} x 3 cm", f"{rng.randint(1, 9)} x {number} mm",
+    ])
+
+
+def fuzz_cells(n, seed=1):
+    rng = random.Random(seed)
+    cells = []
+    for _ in range(n):
+        r = rng.random()
+        if r < 0.05:
+            cells.append(None)
+        elif r < 0.4:
+            cells.append(well_formed(rng))
+        elif r < 0.7:
+            cells.append("".join(rng.choice(TOKENS) for _ in range(rng.randint(0, 6))))
+        else:
+            cells.append("".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 12))))
+    return pd.Series(cells, dtype=object)
+
+
+@pytest.mark.parametrize("vectorized, per_cell", [
+    (parsers.parse_price, parsers.parse_price_value),
+    (parsers.parse_quantity, parsers.parse_quantity_value),
+    (parsers.parse_weight, parsers.parse_weight_value),
+])
+def test_vectorized_parser_matches_per_cell(vectorized, per_cell):
+    cells = fuzz_cells(20_000)
+    expected = np.array([per_cell(v) for v in cells], dtype=np.float64)
+    np.testing.assert_array_equal(vectorized(cells).to_numpy(dtype=np.float64), expected)
+
+
+def test_parse_dimensions_matches_per_cell():
+    cells = fuzz_cells(20_000, seed=2)
+    expected = np.array([parsers.parse_dimensions_value(v) for v in cells], dtype=np.float64)
+    np.testing.assert_array_equal(parsers.parse_dimensions(cells).to_numpy(), expected)
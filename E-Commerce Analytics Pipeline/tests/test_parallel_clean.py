@@ -0,0 +1,59 @@
+import os
+import random
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from data_cleaning import OUTPUT_COLS, clean_products  # noqa: E402
+from loaders import CLEANING_COLUMNS, PRODUCT_COLUMNS, CleanedWriter, read_products  # noqa: E402
+from parallel_clean import clean_parallel  # noqa: E402
+
+
+def write_catalog(path, n=400, seed=0):
+    rng = random.Random(seed)
+    price = lambda: rng.choice([None, f"${rng.uniform(1, 200):.2f}", f"${rng.randint(1, 50)}.99 - $60.00",
+                                "$1,299.00", "Price unavailable"])
+    rows = []
+    for i in range(n):
+        urls = [f"https://img{rng.randint(0, 2)}.example.com/{rng.randint(0, 99)}.jpg" for _ in range(rng.randint(0, 3))]
+        if rng.random() < 0.2:
+            urls.insert(0, "https://images-na.ssl-images-amazon.com/images/G/01/transparent-pixel.jpg")
+        rows.append({
+            "product_id": f"{rng.randint(0, n):032x}",
+            "product_name": rng.choice([f'"Product {i}"  deluxe', None, f"Item {i}"]),
+            "brand": rng.choice(["Acme", "Foo", None]),
+            "category": rng.choice(["Toys & Games | Puzzles", "Home & Kitchen", None]),
+            "list_price": price(),
+            "selling_price": price(),
+            "quantity": rng.choice([None, "1", "2,000", "3.5", "x"]),
+            "about_product": rng.choice([None, "Make sure this fits by entering your model number. | Fun"]),
+            "shipping_weight": rng.choice([None, f"{rng.uniform(0.1, 30):.2f} pounds", "8 ounces (View rates)",
+                                           ".5 Kg"]),
+            "product_dimensions": rng.choice([None, f"{rng.uniform(1, 30):.1f} x 3 x 2 inches", "4 x 3 cm"]),
+            "image_urls": "|".join(urls) or None,
+            "is_amazon_seller": rng.choice(["Y", "N", None]),
+        })
+    raw_names = {std: raw for raw, std in PRODUCT_COLUMNS.items()}
+    df = pd.DataFrame(rows).reindex(columns=CLEANING_COLUMNS).rename(columns=raw_names)
+    df.to_csv(path, index=False)
+
+
+def test_parallel_clean_matches_serial(tmp_path):
+    path = tmp_path / "product_details.csv"
+    write_catalog(path)
+    df = read_products(CLEANING_COLUMNS, path=path).drop_duplicates(subset=["product_id"], ignore_index=True)
+
+    serial = clean_products(df.copy(), verbose=False)[OUTPUT_COLS]
+    parallel = clean_parallel(df.copy(), workers=2)[OUTPUT_COLS]
+    pd.testing.assert_frame_equal(parallel, serial)
+
+    outputs = []
+    for workers in (1, 2):
+        csv_path = tmp_path / f"cleaned_{workers}.csv"
+        with CleanedWriter(str(csv_path), str(tmp_path / f"cleaned_{workers}.parquet"), workers=workers) as writer:
+            writer.write(serial.iloc[:150])
+            writer.write(serial.iloc[150:])
+        outputs.append(csv_path.read_bytes())
+    assert outputs[0] == outputs[1]
@@ -0,0 +1,53 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from prices import LIST_RATIO, SELL_RATIO, fix_prices  # noqa: E402
+
+
+def fix_prices_rows(selling, list_price):
+    # Satır satır referans: swap, eksik fiyat tahmini ve indirim hesabı
+    amount = np.empty_like(selling)
+    pct = np.empty_like(selling)
+    counts = [0, 0, 0]
+    for i in range(len(selling)):
+        s, lp = selling[i], list_price[i]
+        if s > lp:
+            s, lp = lp, s
+            counts[0] += 1
+        if np.isnan(s) and not np.isnan(lp):
+            s = lp * SELL_RATIO
+            counts[1] += 1
+        elif np.isnan(lp) and not np.isnan(s):
+            lp = s * LIST_RATIO
+            counts[2] += 1
+        selling[i], list_price[i] = s, lp
+        amount[i] = lp - s
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pct[i] = np.round(amount[i] / lp * 100, 2)
+        if pct[i] < 0:
+            pct[i] = 0.0
+    return amount, pct, *counts
+
+
+def test_fix_prices_matches_row_loop():
+    rng = np.random.default_rng(0)
+    selling = np.round(rng.uniform(0, 300, 5_000), 2)
+    list_price = np.round(selling * rng.uniform(0.5, 2.0, 5_000), 2)
+    selling[rng.random(5_000) < 0.15] = np.nan
+    list_price[rng.random(5_000) < 0.15] = np.nan
+    list_price[:5] = 0.0
+    # Negatif fiyatlarda indirim yüzdesi negatif çıkar ve 0'a çekilir
+    selling[5:10], list_price[5:10] = -200.0, -100.0
+
+    expected_sell, expected_list = selling.copy(), list_price.copy()
+    expected = fix_prices_rows(expected_sell, expected_list)
+    result = fix_prices(selling, list_price)
+
+    np.testing.assert_array_equal(selling, expected_sell)
+    np.testing.assert_array_equal(list_price, expected_list)
+    for got, want in zip(result, expected):
+        np.testing.assert_array_equal(got, want)
@@ -1,8 +1,16 @@
-from src.data_loader import load_csv, save_csv
-from src.data_cleaner import normalize_column_names, convert_types, handle_missing_values, remove_duplicates
-from src.validators import check_unique, check_missing, check_numeric_ranges
+import sys
+
+from src.data_loader import load_csv, save_csv, save_parquet, ParquetWriter, pq
+from src.data_cleaner import (normalize_column_names, convert_types, repair_related_fields, handle_missing_values,
+                              remove_duplicates, normalize_name, collect_statistics, clean_chunks, NUMERIC_COLS)
+from src.validators import check_unique, duplicate_keys, check_missing, validate_rules, RuleReport
+from src.dedup import KeyCounter
 from src import config
 
+# Kullanım: python main.py                      → tüm dosya bellekte temizlenir
+#           python main.py --chunksize 1000000  → dosya iki geçişte parça parça temizlenir
+#           (+ --bloom 100000000: ID tekrarları Bloom filtresiyle aranır, adaylar çıktı dosyasından doğrulanır)
+
 def main():
     print("Veri Yükleniyor...")
     df = load_csv(config.RAW_DATA_PATH)
@@ -10,22 +18,81 @@ def main():
     print("Temizleme Başlıyor...")
     df = normalize_column_names(df)
     df = convert_types(df)
-    df = handle_missing_values(df)
+    # Medyanlar onarımdan önce, sadece gözlenen değerlerden hesaplanır
+    medians = {col: df[col].median() for col in NUMERIC_COLS}
+    df, repairs = repair_related_fields(df)
+    print(f"Alanlar arası onarım: {repairs}")
+    df = handle_missing_values(df, medians)
     df = remove_duplicates(df)
 
     print("Validasyon yapılıyor...")
     if not check_unique(df, config.ID_COLUMN):
         print("Transaction ID Benzersiz Değil!!!")
+        print(duplicate_keys(df, config.ID_COLUMN).head(10))
     
     print("Eksik veri kontrol ediliyor...")
     print(check_missing(df))
 
-    print("Sayısal alan kontrolleri:")
-    print(check_numeric_ranges(df))
+    print("Kural kontrolleri:")
+    print(validate_rules(df).to_string(index=False))
 
     print("Temizlenmiş veri kayıt ediliyor...")
     save_csv(df, config.PROCESSED_DATA_PATH)
+    if pq is not None:
+        lossy = save_parquet(df, config.PARQUET_DATA_PATH)
+        print(f"Kompakt Parquet çıktısı: {config.PARQUET_DATA_PATH}")
+        print(f"Kompakt tipe sığmadığı için boş yazılan değer: {lossy}")
+    print("Temizleme Tamamlandı")
+
+def main_streaming(chunksize: int, bloom_capacity: int | None = None):
+    print("Medyanlar ve ürün fiyatları hesaplanıyor (1. geçiş)...")
+    # İlk geçişte sadece sayısal sütunlar ve ürün adı okunur
+    used = lambda col: normalize_name(col) in NUMERIC_COLS + ["item"]
+    medians, item_prices = collect_statistics(load_csv(config.RAW_DATA_PATH, chunksize, usecols=used))
+    print(medians)
+
+    print("Parça parça temizleniyor ve kayıt ediliyor (2. geçiş)...")
+    rows = 0
+    missing = 0
+    repairs = {}
+    ids = KeyCounter(bloom_capacity)
+    rules = RuleReport()
+    parquet = ParquetWriter(config.PARQUET_DATA_PATH) if pq is not None else None
+    chunks = clean_chunks(load_csv(config.RAW_DATA_PATH, chunksize), medians, item_prices, repairs)
+    for i, chunk in enumerate(chunks):
+        save_csv(chunk, config.PROCESSED_DATA_PATH, append=i > 0)
+        if parquet is not None:
+            parquet.write(chunk)
+        ids.update(chunk[config.ID_COLUMN])
+        rules.update(chunk)
+        missing = missing + check_missing(chunk)
+        rows += len(chunk)
+    if parquet is not None:
+        parquet.close()
+        print(f"Kompakt Parquet çıktısı: {config.PARQUET_DATA_PATH}")
+        print(f"Kompakt tipe sığmadığı için boş yazılan değer: {parquet.lossy}")
+    print(f"Kayıt edilen satır: {rows}")
+    print(f"Alanlar arası onarım: {repairs}")
+
+    print("Validasyon yapılıyor...")
+    # Bloom filtresinin adayları yazılan dosyanın ID sütunu yeniden okunarak kesinleştirilir
+    written = (chunk[config.ID_COLUMN] for chunk in
+               load_csv(config.PROCESSED_DATA_PATH, chunksize, usecols=[config.ID_COLUMN]))
+    duplicates = ids.duplicates(None if ids.exact else written)
+    if len(duplicates):
+        print("Transaction ID Benzersiz Değil!!!")
+        print(duplicates.head(10))
+
+    print("Eksik veri kontrol ediliyor...")
+    print(missing)
+
+    print("Kural kontrolleri:")
+    print(rules.table().to_string(index=False))
     print("Temizleme Tamamlandı")
 
 if __name__ == "__main__":
+    if "--chunksize" in sys.argv:
+        bloom = int(sys.argv[sys.argv.index("--bloom") + 1]) if "--bloom" in sys.argv else None
+        main_streaming(int(sys.argv[sys.argv.index("--chunksize") + 1]), bloom)
+    else:
         main()
\ No newline at end of file
@@ -1,3 +1,4 @@
 RAW_DATA_PATH = "data/raw/dirty_cafe_sales.csv"
 PROCESSED_DATA_PATH = "data/processed/cleaned_cafe_sales.csv"
+PARQUET_DATA_PATH = "data/processed/cleaned_cafe_sales.parquet"
 ID_COLUMN = "transaction_id"
\ No newline at end of file
@@ -1,24 +1,121 @@
+from typing import Iterable, Iterator
+
 import pandas as pd
 import numpy as np
 
+from src.dedup import HashSet, row_hashes
+
+NUMERIC_COLS = ["quantity", "price_per_unit", "total_spent"]
+# Ürün adı yerine yazılmış hata işaretleri; fiyat tablosuna alınmaz
+UNKNOWN_ITEMS = ["ERROR", "UNKNOWN"]
+# total_spent / price_per_unit bu kadar yakınsa tam sayı adet kabul edilir (float bölme hatası payı)
+QUANTITY_TOLERANCE = 1e-6
+
+
+class MedianCounter:
+    # Kasa verisinde farklı değer sayısı azdır: değer başına sayaç tutulur, medyan tam (exact) hesaplanır
+    def __init__(self):
+        self.counts = pd.Series(dtype="int64")
+
+    def update(self, values: pd.Series):
+        # Ham metinler sayılır, sayıya sadece farklı değerler çevrilir ("ERROR" → NaN düşer)
+        counts = values.value_counts()
+        counts.index = pd.to_numeric(counts.index, errors="coerce")
+        counts = counts[counts.index.notna()].groupby(level=0).sum()
+        self.counts = self.counts.add(counts, fill_value=0).astype("int64")
+
+    def median(self) -> float:
+        counts = self.counts.sort_index()
+        total = int(counts.sum())
+        if total == 0:
+            return np.nan
+        cumulative = counts.cumsum().to_numpy()
+        values = counts.index.to_numpy(dtype=float)
+        low = values[np.searchsorted(cumulative, (total - 1) // 2, side="right")]
+        high = values[np.searchsorted(cumulative, total // 2, side="right")]
+        return float((low + high) / 2)
+
+
+class ItemPriceCounter:
+    # (ürün, birim fiyat) çiftleri tek value_counts ile sayılır; ürünün fiyatı en sık görülen fiyatıdır
+    def __init__(self):
+        self.counts = None
+
+    def update(self, items: pd.Series, prices: pd.Series) -> "ItemPriceCounter":
+        counts = pd.DataFrame({"item": items, "price": prices}).value_counts()
+        item = counts.index.get_level_values("item")
+        price = pd.to_numeric(counts.index.get_level_values("price"), errors="coerce")
+        valid = price.notna() & ~item.isin(UNKNOWN_ITEMS)
+        counts = counts[valid].groupby([item[valid], price[valid]]).sum()
+        self.counts = counts if self.counts is None else self.counts.add(counts, fill_value=0)
+        return self
+
+    def table(self) -> pd.Series:
+        if self.counts is None or self.counts.empty:
+            return pd.Series(dtype="float64")
+        # Eşit sayıda görülen fiyatlardan küçük olan seçilir (sıralama parçalamadan bağımsız)
+        counts = self.counts.sort_index().sort_values(ascending=False, kind="stable")
+        top = counts[~counts.index.get_level_values(0).duplicated()]
+        return pd.Series(top.index.get_level_values(1).to_numpy(dtype=float), index=top.index.get_level_values(0))
+
+
+def normalize_name(col: str) -> str:
+    return col.strip().lower().replace(" ", "_")
 
 def normalize_column_names(df: pd.DataFrame) -> pd.DataFrame:
-    df.columns = [col.strip().lower().replace(" ", "_") for col in df.columns]
+    df.columns = [normalize_name(col) for col in df.columns]
     return df
 
 def convert_types(df: pd.DataFrame) -> pd.DataFrame:
-    numeric_cols = ["quantity", "price_per_unit", "total_spent"]
-    for col in numeric_cols:
+    for col in NUMERIC_COLS:
         df[col] = pd.to_numeric(df[col], errors="coerce")  # "ERROR" → NaN
     return df
 
-def handle_missing_values(df: pd.DataFrame) -> pd.DataFrame:
-    if "quantity" in df.columns:
-        df["quantity"] = df["quantity"].fillna(df["quantity"].median())
-    if "price_per_unit" in df.columns:
-        df["price_per_unit"] = df["price_per_unit"].fillna(df["price_per_unit"].median())
-    if "total_spent" in df.columns:
-        df["total_spent"] = df["total_spent"].fillna(df["total_spent"].median())
+def repair_related_fields(df: pd.DataFrame, item_prices: pd.Series | None = None) -> tuple[pd.DataFrame, dict]:
+    # quantity × price_per_unit = total_spent: eksik alan önce aynı satırın diğer iki alanından,
+    # fiyat bulunamazsa ürünün bilinen fiyatından hesaplanır; kalanlar medyanla doldurulmak üzere bırakılır
+    if item_prices is None:
+        item_prices = ItemPriceCounter().update(df["item"], df["price_per_unit"]).table()
+    qty = df["quantity"].to_numpy(dtype="float64", copy=True)
+    price = df["price_per_unit"].to_numpy(dtype="float64", copy=True)
+    total = df["total_spent"].to_numpy(dtype="float64", copy=True)
+    repairs = {}
+
+    fill = np.isnan(price) & ~np.isnan(total) & (qty > 0)
+    price[fill] = total[fill] / qty[fill]
+    repairs["price_per_unit_from_total"] = int(fill.sum())
+
+    known = df["item"].map(item_prices).to_numpy(dtype="float64")
+    fill = np.isnan(price) & ~np.isnan(known)
+    price[fill] = known[fill]
+    repairs["price_per_unit_from_item"] = int(fill.sum())
+
+    # Adet sadece oran pozitif bir tam sayıya denk geliyorsa onarılır; diğerleri medyana bırakılır
+    candidate = np.isnan(qty) & ~np.isnan(total) & (price > 0)
+    ratio = np.divide(total, price, out=np.full_like(total, np.nan), where=candidate)
+    rounded = np.rint(ratio)
+    fill = candidate & (rounded >= 1) & (np.abs(ratio - rounded) <= QUANTITY_TOLERANCE)
+    qty[fill] = rounded[fill]
+    repairs["quantity_from_total"] = int(fill.sum())
+    repairs["quantity_from_total_rejected"] = int((candidate & ~fill).sum())
+
+    fill = np.isnan(total) & ~np.isnan(qty) & ~np.isnan(price)
+    total[fill] = qty[fill] * price[fill]
+    repairs["total_spent_from_quantity_price"] = int(fill.sum())
+
+    df["quantity"] = qty
+    df["price_per_unit"] = price
+    df["total_spent"] = total
+    for col, values in zip(NUMERIC_COLS, [qty, price, total]):
+        repairs[f"{col}_from_median"] = int(np.isnan(values).sum())
+    return df, repairs
+
+def handle_missing_values(df: pd.DataFrame, medians: dict | None = None) -> pd.DataFrame:
+    # medians verilmezse (tek parça çalıştırma) medyanlar df'in kendisinden hesaplanır
+    for col in NUMERIC_COLS:
+        if col in df.columns:
+            median = df[col].median() if medians is None else medians[col]
+            df[col] = df[col].fillna(median)
     if "item" in df.columns:
         df["item"] = df["item"].fillna("Unknown")
     if "payment_method" in df.columns:
@@ -33,4 +130,40 @@ def handle_missing_values(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 def remove_duplicates(df: pd.DataFrame) -> pd.DataFrame:
-    return df.drop_duplicates()
\ No newline at end of file
+    return df.drop_duplicates()
+
+def collect_statistics(chunks: Iterable[pd.DataFrame]) -> tuple[dict, pd.Series]:
+    # 1. geçiş: sayısal sütunların değer sayaçları ve ürün-fiyat sayıları tutulur
+    counters = {col: MedianCounter() for col in NUMERIC_COLS}
+    prices = ItemPriceCounter()
+    for chunk in chunks:
+        chunk = normalize_column_names(chunk)
+        for col, counter in counters.items():
+            counter.update(chunk[col])
+        prices.update(chunk["item"], chunk["price_per_unit"])
+    return {col: counter.median() for col, counter in counters.items()}, prices.table()
+
+def clean_chunks(chunks: Iterable[pd.DataFrame], medians: dict, item_prices: pd.Series,
+                 repairs: dict | None = None) -> Iterator[pd.DataFrame]:
+    # 2. geçiş: son tarih ve görülen satırların hash'leri parçadan parçaya taşınır;
+    # repairs verilirse parçaların onarım sayıları bu sözlükte toplanır
+    last_date = None
+    seen = HashSet()
+    for chunk in chunks:
+        chunk = convert_types(normalize_column_names(chunk))
+        # Hatasız bir parçada sütun int64 kalabilir; tüm dosyadaki gibi float64 olmalı
+        chunk[NUMERIC_COLS] = chunk[NUMERIC_COLS].astype("float64")
+        chunk, chunk_repairs = repair_related_fields(chunk, item_prices)
+        if repairs is not None:
+            for key, count in chunk_repairs.items():
+                repairs[key] = repairs.get(key, 0) + count
+        chunk = handle_missing_values(chunk, medians)
+        if "transaction_date" in chunk.columns:
+            # ffill parçanın başındaki boşlukları dolduramaz; önceki parçanın son tarihi kullanılır
+            if last_date is not None:
+                chunk["transaction_date"] = chunk["transaction_date"].fillna(last_date)
+            dates = chunk["transaction_date"].dropna()
+            if len(dates):
+                last_date = dates.iloc[-1]
+        # Tekrar kontrolü satır hash'iyle yapılır; önceki parçalarda görülen satırlar da atılır
+        yield chunk[seen.add(row_hashes(chunk))]
\ No newline at end of file
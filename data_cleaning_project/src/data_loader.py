@@ -1,7 +1,53 @@
 import pandas as pd
 
-def load_csv(path: str) -> pd.DataFrame:
-    return pd.read_csv(path)
+from src.schema import arrow_schema, compact
 
-def save_csv(df: pd.DataFrame, path: str):
-    df.to_csv(path, index=False)
\ No newline at end of file
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow yoksa Parquet çıktısı yazılmaz, CSV yeterlidir
+    pa = pq = None
+
+# Her satır grubu için min/max istatistiği yazılır; okuyucular filtreye uymayan grupları atlar
+ROW_GROUP_SIZE = 1_000_000
+
+def load_csv(path: str, chunksize: int | None = None, usecols=None) -> pd.DataFrame:
+    # chunksize verilirse DataFrame yerine parça parça okuyan bir iterator döner
+    return pd.read_csv(path, chunksize=chunksize, usecols=usecols)
+
+def save_csv(df: pd.DataFrame, path: str, append: bool = False):
+    df.to_csv(path, index=False, mode="a" if append else "w", header=not append)
+
+class ParquetWriter:
+    # Temizlenmiş parçaları kompakt şemaya çevirip tek bir Parquet dosyasına ekler;
+    # kompakt tipe sığmadığı için boş yazılan değerler lossy'de sütun başına sayılır
+    def __init__(self, path: str, row_group_size: int = ROW_GROUP_SIZE):
+        self.writer = pq.ParquetWriter(path, arrow_schema(), compression="zstd", write_statistics=True)
+        self.row_group_size = row_group_size
+        self.lossy = {}
+
+    def write(self, df: pd.DataFrame):
+        compacted, lossy = compact(df)
+        for col, count in lossy.items():
+            self.lossy[col] = self.lossy.get(col, 0) + count
+        table = pa.Table.from_pandas(compacted, schema=arrow_schema(), preserve_index=False)
+        self.writer.write_table(table, row_group_size=self.row_group_size)
+
+    def close(self):
+        self.writer.close()
+
+def save_parquet(df: pd.DataFrame, path: str) -> dict:
+    writer = ParquetWriter(path)
+    try:
+        writer.write(df)
+    finally:
+        writer.close()
+    return writer.lossy
+
+def load_parquet(path: str, columns: list | None = None, filters=None) -> pd.DataFrame:
+    # filters satır grubu istatistikleriyle değerlendirilir, ör. [("transaction_date", ">=", date)]
+    # date32 sütunu Python date nesneleri yerine datetime64 olarak, tamsayılar boş değer içerse de
+    # float'a dönmeden COLUMN_TYPES'taki nullable tiplerle gelir
+    integers = {pa.uint32(): pd.UInt32Dtype(), pa.uint8(): pd.UInt8Dtype()}
+    table = pq.read_table(path, columns=columns, filters=filters)
+    return table.to_pandas(date_as_object=False, types_mapper=integers.get)
\ No newline at end of file
@@ -0,0 +1,101 @@
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+BLOOM_ERROR_RATE = 0.01
+
+
+def row_hashes(values: pd.Series | pd.DataFrame) -> np.ndarray:
+    # Satır (veya tek sütun) başına 64-bit hash; index hash'e katılmaz
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+
+class HashSet:
+    # Görülen hash'ler sıralı bir uint64 dizisinde tutulur (farklı anahtar başına 8 byte)
+    def __init__(self):
+        self.hashes = np.empty(0, dtype=np.uint64)
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        if not len(self):
+            return np.zeros(len(hashes), dtype=bool)
+        idx = np.minimum(np.searchsorted(self.hashes, hashes), len(self) - 1)
+        return self.hashes[idx] == hashes
+
+    def add(self, hashes: np.ndarray) -> np.ndarray:
+        # Daha önce ve bu parçada ilk kez görülen hash'ler için True maskesi döner
+        first = ~pd.Series(hashes).duplicated().to_numpy() & ~self.contains(hashes)
+        new = np.sort(hashes[first])
+        self.hashes = np.insert(self.hashes, np.searchsorted(self.hashes, new), new)
+        return first
+
+
+class BloomFilter:
+    # capacity anahtar için error_rate yanlış pozitif oranı hedeflenir; anahtar başına ~1.2 byte (%1'de)
+    def __init__(self, capacity: int, error_rate: float = BLOOM_ERROR_RATE):
+        self.n_bits = max(int(-capacity * np.log(error_rate) / np.log(2) ** 2), 64)
+        self.n_hashes = max(round(self.n_bits / max(capacity, 1) * np.log(2)), 1)
+        self.bits = np.zeros(-(-self.n_bits // 8), dtype=np.uint8)
+
+    def _positions(self, hashes: np.ndarray):
+        # Çift hash: i. konum h1 + i·h2 (mod bit sayısı), h1/h2 64-bit hash'in iki yarısıdır
+        h1 = hashes & np.uint64(0xFFFFFFFF)
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        for i in range(self.n_hashes):
+            yield (h1 + np.uint64(i) * h2) % np.uint64(self.n_bits)
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        found = np.ones(len(hashes), dtype=bool)
+        for pos in self._positions(hashes):
+            found &= (self.bits[pos >> np.uint64(3)] >> (pos & np.uint64(7)).astype(np.uint8)) & 1 == 1
+        return found
+
+    def add(self, hashes: np.ndarray) -> np.ndarray:
+        # Daha önce görülmüş olabilecek hash'ler için True maskesi döner (yanlış pozitif olabilir)
+        seen = pd.Series(hashes).duplicated().to_numpy() | self.contains(hashes)
+        for pos in self._positions(hashes):
+            np.bitwise_or.at(self.bits, pos >> np.uint64(3), np.left_shift(1, pos & np.uint64(7)).astype(np.uint8))
+        return seen
+
+
+class KeyCounter:
+    # Anahtarları parça parça izler ve birden fazla görülenleri sayılarıyla raporlar.
+    # bloom_capacity verilmezse hash'ler HashSet'te tutulur ve tekrarlar doğrudan sayılır;
+    # verilirse Bloom filtresinin işaretlediği adaylar duplicates()'e verilen ikinci geçişte
+    # metin olarak kesin sayılır (bellek sadece aday sayısıyla büyür)
+    def __init__(self, bloom_capacity: int | None = None):
+        self.seen = HashSet() if bloom_capacity is None else BloomFilter(bloom_capacity)
+        self.repeated = []
+        self.candidates = HashSet()
+        self.total = 0
+
+    @property
+    def exact(self) -> bool:
+        return isinstance(self.seen, HashSet)
+
+    def update(self, keys: pd.Series):
+        hashes = row_hashes(keys)
+        repeated = self.seen.add(hashes)
+        if self.exact:
+            repeated = ~repeated
+            # Sadece tekrar eden satırların anahtarları saklanır; sayım rapor sırasında yapılır
+            self.repeated.append(keys[repeated])
+        else:
+            self.candidates.add(hashes[repeated])
+        self.total += len(keys)
+
+    def duplicates(self, chunks: Iterable[pd.Series] | None = None) -> pd.Series:
+        # Tekrarlanan anahtar → toplam görülme sayısı (en sık olan başta)
+        if self.exact:
+            repeated = pd.concat(self.repeated) if self.repeated else pd.Series(dtype="object")
+            counts = repeated.value_counts() + 1
+        else:
+            if chunks is None:
+                raise ValueError("Bloom filtresi adaylarını doğrulamak için anahtarlar yeniden verilmeli")
+            hits = [keys[self.candidates.contains(row_hashes(keys))] for keys in chunks]
+            counts = pd.concat(hits).value_counts() if hits else pd.Series(dtype="int64")
+            counts = counts[counts > 1]
+        return counts.sort_values(ascending=False, kind="stable").rename("count")
\ No newline at end of file
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow yoksa sadece bellekteki kompakt tipler kullanılabilir
+    pa = None
+
+ID_PREFIX = "TXN_"
+# Temizlenmiş kasa verisinin kompakt tipleri; az sayıda farklı değeri olan metinler kategori olur.
+# Tamsayılar boş değer alabilen (nullable) tiplerdir: kayıpsız çevrilemeyen değerler hata yerine boş kalır
+COLUMN_TYPES = {
+    "transaction_id": "UInt32",
+    "item": "category",
+    "quantity": "UInt8",
+    "price_per_unit": "float32",
+    "total_spent": "float32",
+    "payment_method": "category",
+    "location": "category",
+    "transaction_date": "datetime64[s]",
+}
+
+
+def _to_int(values: pd.Series, dtype: str) -> pd.Series:
+    # Tamsayı tipine sadece kayıpsız çevrilebilen değerler alınır; kesirli ve aralık dışı değerler boş kalır
+    numbers = values.to_numpy(dtype="float64", na_value=np.nan)
+    info = np.iinfo(dtype.lower())
+    ok = (numbers == np.round(numbers)) & (numbers >= info.min) & (numbers <= info.max)
+    return pd.Series(numbers, index=values.index, name=values.name).where(ok).astype(dtype)
+
+def parse_transaction_ids(ids: pd.Series) -> pd.Series:
+    # "TXN_<n>" → n; baştaki sıfırlar geri yazılamayacağı için kabul edilmez, biçime uymayanlar boş kalır
+    valid = ids.astype("string").str.fullmatch(ID_PREFIX + r"(?:0|[1-9]\d*)", na=False)
+    numbers = pd.to_numeric(ids.astype("string").str.slice(len(ID_PREFIX)).where(valid), errors="coerce")
+    return _to_int(numbers.rename(ids.name), COLUMN_TYPES["transaction_id"])
+
+def compact(df: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
+    # Kompakt tabloyu ve sütun başına kayıpsız çevrilemediği için boş bırakılan değer sayısını döndürür
+    df = df[list(COLUMN_TYPES)].copy()
+    converted = {
+        "transaction_id": parse_transaction_ids(df["transaction_id"]),
+        "quantity": _to_int(df["quantity"], COLUMN_TYPES["quantity"]),
+    }
+    lossy = {}
+    for col, values in converted.items():
+        lossy[col] = int((df[col].notna() & values.isna()).sum())
+        df[col] = values
+    return df.astype(COLUMN_TYPES), lossy
+
+def arrow_schema():
+    # Parquet tipleri: tarih gün hassasiyetinde (date32), kategoriler sözlük kodlu
+    category = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ("transaction_id", pa.uint32()),
+        ("item", category),
+        ("quantity", pa.uint8()),
+        ("price_per_unit", pa.float32()),
+        ("total_spent", pa.float32()),
+        ("payment_method", category),
+        ("location", category),
+        ("transaction_date", pa.date32()),
+    ])
\ No newline at end of file
@@ -1,13 +1,101 @@
+import numpy as np
+import pandas as pd
+
+from src.dedup import KeyCounter
+
+SAMPLE_SIZE = 5
+# Temizleme sonrası beklenen değerler (doldurma değerleri dahil)
+ITEMS = ["Coffee", "Tea", "Cake", "Cookie", "Juice", "Salad", "Sandwich", "Smoothie", "Unknown"]
+PAYMENT_METHODS = ["Cash", "Credit Card", "Digital Wallet", "Other"]
+LOCATIONS = ["In-store", "Takeaway", "Unspecified"]
+
+# Her kural hatalı satırlar için bir maske üretir; NaN değerler sadece not_null kuralında hata sayılır
+RULES = [
+    {"name": "transaction_id_not_null", "check": "not_null", "column": "transaction_id"},
+    {"name": "transaction_id_format", "check": "regex", "column": "transaction_id", "pattern": r"TXN_\d+"},
+    {"name": "quantity_positive", "check": "range", "column": "quantity", "gt": 0},
+    {"name": "price_per_unit_positive", "check": "range", "column": "price_per_unit", "gt": 0},
+    {"name": "total_spent_positive", "check": "range", "column": "total_spent", "gt": 0},
+    {"name": "transaction_date_not_null", "check": "not_null", "column": "transaction_date"},
+    {"name": "item_known", "check": "enum", "column": "item", "values": ITEMS},
+    {"name": "payment_method_known", "check": "enum", "column": "payment_method", "values": PAYMENT_METHODS},
+    {"name": "location_known", "check": "enum", "column": "location", "values": LOCATIONS},
+    {"name": "total_matches_quantity_price", "check": "product", "columns": ["quantity", "price_per_unit"],
+     "column": "total_spent", "tolerance": 0.01},
+]
+
+
 def check_unique(df, column):
     return df[column].is_unique
 
+def duplicate_keys(df, column):
+    # Birden fazla görülen anahtarlar ve görülme sayıları
+    counter = KeyCounter()
+    counter.update(df[column])
+    return counter.duplicates()
+
 def check_missing(df):
     return df.isnull().sum()
 
-def check_numeric_ranges(df):
-    problems = {}
-    if "quantity" in df.columns:
-        problems["quantity"] = df[df["quantity"] <= 0]
-    if "price_per_unit" in df.columns:
-        problems["price_per_unit"] = df[df["price_per_unit"] <= 0]
-    return problems
+def _failed(df, rule):
+    values = df[rule["column"]]
+    check = rule["check"]
+    if check == "not_null":
+        return values.isna().to_numpy()
+    if check == "range":
+        values = values.to_numpy(dtype="float64")
+        failed = np.zeros(len(values), dtype=bool)
+        for op, compare in [("gt", np.less_equal), ("ge", np.less), ("lt", np.greater_equal), ("le", np.greater)]:
+            if op in rule:
+                failed |= compare(values, rule[op])
+        return failed
+    if check == "enum":
+        return (values.notna() & ~values.isin(rule["values"])).to_numpy()
+    if check == "regex":
+        return (~values.astype("string").str.fullmatch(rule["pattern"], na=True)).to_numpy(dtype=bool)
+    if check == "product":
+        expected = np.prod([df[col].to_numpy(dtype="float64") for col in rule["columns"]], axis=0)
+        # NaN içeren satırlarda fark NaN olur ve karşılaştırma False döner
+        return np.abs(values.to_numpy(dtype="float64") - expected) > rule["tolerance"]
+    raise ValueError(f"Bilinmeyen kural tipi: {check}")
+
+class RuleReport:
+    # Kuralları parça parça değerlendirir; her kural için denetlenen ve hatalı satır sayısı ile
+    # en fazla sample_size satır indeksi tutulur. Sütunu olmayan parçalar kuralın oranına girmez
+    def __init__(self, rules=RULES, sample_size=SAMPLE_SIZE):
+        self.rules = list(rules)
+        self.sample_size = sample_size
+        self.rows = 0
+        self.checked = {rule["name"]: 0 for rule in self.rules}
+        self.failed = {rule["name"]: 0 for rule in self.rules}
+        self.samples = {rule["name"]: [] for rule in self.rules}
+
+    def update(self, df):
+        self.rows += len(df)
+        for rule in self.rules:
+            if not set([rule["column"], *rule.get("columns", [])]) <= set(df.columns):
+                continue
+            mask = _failed(df, rule)
+            name = rule["name"]
+            self.checked[name] += len(df)
+            self.failed[name] += int(mask.sum())
+            room = self.sample_size - len(self.samples[name])
+            if room > 0:
+                self.samples[name] += df.index[np.flatnonzero(mask)[:room]].tolist()
+
+    def table(self):
+        failed = pd.Series(self.failed)
+        checked = pd.Series(self.checked)
+        return pd.DataFrame({
+            "rule": failed.index,
+            "checked": checked.to_numpy(),
+            "failed": failed.to_numpy(),
+            # Hiç denetlenmemiş kuralın oranı NaN kalır
+            "ratio": (failed / checked.replace(0, np.nan)).round(4).to_numpy(),
+            "sample_rows": [self.samples[name] for name in failed.index],
+        })
+
+def validate_rules(df, rules=RULES, sample_size=SAMPLE_SIZE):
+    report = RuleReport(rules, sample_size)
+    report.update(df)
+    return report.table()
@@ -0,0 +1,38 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from src import config
+from src.data_loader import load_csv
+from src.dedup import KeyCounter
+
+RAW_PATH = os.path.join(ROOT, config.RAW_DATA_PATH)
+
+
+@pytest.fixture(scope="module")
+def ids() -> pd.Series:
+    # Gerçek ham dosyadaki ID'lere tekrar eden 500 satır eklenir
+    ids = load_csv(RAW_PATH)["Transaction ID"]
+    return pd.concat([ids, ids.sample(500, random_state=0)], ignore_index=True)
+
+@pytest.mark.parametrize("bloom_capacity", [None, 20_000])
+def test_duplicate_report_matches_value_counts(ids, bloom_capacity):
+    expected = ids.value_counts()
+    expected = expected[expected > 1]
+
+    counter = KeyCounter(bloom_capacity)
+    chunks = [ids.iloc[i:i + 999] for i in range(0, len(ids), 999)]
+    for chunk in chunks:
+        counter.update(chunk)
+    result = counter.duplicates(None if counter.exact else chunks)
+
+    assert counter.total == len(ids)
+    pd.testing.assert_series_equal(result.sort_index(), expected.sort_index().rename("count"),
+                                   check_index_type=False, check_names=False)
+    assert np.all(np.diff(result.to_numpy()) <= 0)
\ No newline at end of file
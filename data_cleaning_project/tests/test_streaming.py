@@ -0,0 +1,52 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from src import config
+from src.data_cleaner import (NUMERIC_COLS, clean_chunks, collect_statistics, convert_types,
+                              handle_missing_values, normalize_column_names, normalize_name,
+                              remove_duplicates, repair_related_fields)
+from src.data_loader import load_csv
+
+RAW_PATH = os.path.join(ROOT, config.RAW_DATA_PATH)
+
+
+@pytest.fixture(scope="module")
+def raw_path(tmp_path_factory) -> str:
+    # Gerçek ham dosyaya parçalar arası tekrar eden satırlar eklenir; 777'lik parçaların ilk satırında
+    # tarih boştur (önceki parçanın son tarihiyle doldurulmalı)
+    df = pd.read_csv(RAW_PATH)
+    df = pd.concat([df, df.sample(500, random_state=0)], ignore_index=True)
+    df.loc[::777, "Transaction Date"] = np.nan
+    path = tmp_path_factory.mktemp("raw") / "dirty_cafe_sales.csv"
+    df.to_csv(path, index=False)
+    return str(path)
+
+def clean_in_memory(path: str) -> tuple[pd.DataFrame, dict]:
+    # main() ile aynı adımlar
+    df = convert_types(normalize_column_names(load_csv(path)))
+    medians = {col: df[col].median() for col in NUMERIC_COLS}
+    df, repairs = repair_related_fields(df)
+    df = handle_missing_values(df, medians)
+    return remove_duplicates(df), repairs
+
+def clean_streaming(path: str, chunksize: int) -> tuple[pd.DataFrame, dict]:
+    # main_streaming() ile aynı iki geçiş
+    used = lambda col: normalize_name(col) in NUMERIC_COLS + ["item"]
+    medians, item_prices = collect_statistics(load_csv(path, chunksize, usecols=used))
+    repairs = {}
+    chunks = list(clean_chunks(load_csv(path, chunksize), medians, item_prices, repairs))
+    return pd.concat(chunks), repairs
+
+@pytest.mark.parametrize("chunksize", [777, 4000])
+def test_chunked_cleaning_matches_in_memory(raw_path, chunksize):
+    expected, expected_repairs = clean_in_memory(raw_path)
+    result, repairs = clean_streaming(raw_path, chunksize)
+    assert repairs == expected_repairs
+    pd.testing.assert_frame_equal(result.reset_index(drop=True), expected.reset_index(drop=True))
\ No newline at end of file